@@ -1,6 +1,8 @@
 import os
 import json
 import logging
+import functools
+import hashlib
 import numpy as np
 from typing import List, Optional, Tuple, Dict, Any
 
@@ -8,11 +10,20 @@ from typing import List, Optional, Tuple, Dict, Any
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize a vector (or each row of a matrix) as float32. Zero vectors stay zero."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return (vectors / (norms + 1e-12)).astype(np.float32, copy=False)
+
 class LocalBrain:
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', cache_size: int = 10000):
         self.model = None
         self.model_name = model_name
         self._load_model()
+        # Same "title description" texts come back across cycles and votes
+        self._vec_cache = functools.lru_cache(maxsize=cache_size)(self._vectorize_impl)
 
     def _load_model(self):
         try:
@@ -24,28 +35,64 @@ class LocalBrain:
             logger.warning(f"Failed to load model {self.model_name}: {e}. LocalBrain will operate in mock mode.")
 
     def vectorize(self, text: str) -> np.ndarray:
-        """Convert text to vector embedding."""
-        if not text:
-            return np.zeros(384) # Default dimension for all-MiniLM-L6-v2
+        """
+        Convert text to an L2-normalized float32 vector embedding.
+        Results are LRU-cached per text and returned read-only (copy before modifying).
+        """
+        return self._vec_cache(text)
 
-        if self.model:
-            return self.model.encode(text)
+    def _vectorize_impl(self, text: str) -> np.ndarray:
+        if not text:
+            vec = np.zeros(384, dtype=np.float32) # Default dimension for all-MiniLM-L6-v2
+        elif self.model:
+            vec = l2_normalize(self.model.encode(text))
         else:
             # Mock embedding (random vector)
-            return np.random.rand(384)
+            vec = l2_normalize(np.random.rand(384))
+        vec.setflags(write=False)
+        return vec
 
-    def calculate_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
+    def vectorize_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """Embed many texts in one model call. Returns an (n, dim) float32 matrix of unit rows."""
+        if not texts:
+            return np.zeros((0, 384), dtype=np.float32)
+
+        if not self.model:
+            # Mock mode: no batched model to call
+            return np.array([self.vectorize(t) for t in texts])
+
+        vectors = self.model.encode(
+            [t or " " for t in texts],
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True
+        ).astype(np.float32, copy=False)
+        # Same contract as vectorize(): empty text -> zero vector
+        empty = [i for i, t in enumerate(texts) if not t]
+        if empty:
+            vectors[empty] = 0.0
+        return vectors
+
+    def calculate_similarity(self, vec1: np.ndarray, vec2: np.ndarray, pre_normalized: bool = False) -> float:
+        """
+        Calculate cosine similarity between two vectors.
+        With pre_normalized=True both inputs are assumed unit-length and the
+        similarity is a plain dot product.
+        """
         if vec1 is None or vec2 is None:
             return 0.0
 
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        if pre_normalized:
+            return float(np.dot(vec1, vec2))
 
-        if norm1 == 0 or norm2 == 0:
+        # Three dot products and one sqrt instead of two np.linalg.norm calls
+        vec1 = np.ascontiguousarray(vec1, dtype=np.float32).ravel()
+        vec2 = np.ascontiguousarray(vec2, dtype=np.float32).ravel()
+        sq_norms = np.vdot(vec1, vec1) * np.vdot(vec2, vec2)
+        if sq_norms == 0:
             return 0.0
 
-        return float(np.dot(vec1, vec2) / (norm1 * norm2))
+        return float(np.vdot(vec1, vec2) / np.sqrt(sq_norms))
 
     def calculate_user_vector(self, starred_descriptions: List[str]) -> np.ndarray:
         """Deprecated: Use generate_interest_clusters instead."""
@@ -60,17 +107,16 @@ class LocalBrain:
         if not descriptions:
             return []
 
-        vectors = []
-        for desc in descriptions:
-            vectors.append(self.vectorize(desc))
+        return self.cluster(self.vectorize_batch(descriptions), k=k)
 
-        if not vectors:
+    def cluster(self, vectors: np.ndarray, k: int = 5) -> List[np.ndarray]:
+        """Cluster precomputed embeddings (n, dim) with KMeans and return the K centers."""
+        vectors_np = np.asarray(vectors)
+        if len(vectors_np) == 0:
             return []
 
-        vectors_np = np.array(vectors)
-
         # If fewer data points than k, use all points as centers
-        if len(vectors) <= k:
+        if len(vectors_np) <= k:
             return [v for v in vectors_np]
 
         try:
@@ -86,6 +132,10 @@ class LocalBrain:
              return [np.mean(vectors_np, axis=0)]
 
 class CloudBrain:
+    # analyze_repo() results that are placeholders, not real analyses (never cache these)
+    RATE_LIMITED_ANALYSIS = ("⏳ Rate limited - skipped analysis", 0.3)
+    MOCK_ANALYSIS = ("A interesting repository found by the mock brain.", 0.85)
+
     def __init__(self, api_key: Optional[str] = None, db_path: str = "data/tuner.db"):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model = None
@@ -93,6 +143,8 @@ class CloudBrain:
         self.db_path = db_path
         self.rate_limited = False
         self.rate_limit_reset_time = 0
+        # Concurrent analyze_repo calls callers should allow (Gemini per-minute quotas)
+        self.max_concurrency = 4
         self._init_client()
 
     def _init_client(self):
@@ -209,8 +261,18 @@ class CloudBrain:
         
         # Mock response or error fallback
         if error == "rate_limit":
-            return "⏳ Rate limited - skipped analysis", 0.3
-        return "A interesting repository found by the mock brain.", 0.85
+            return self.RATE_LIMITED_ANALYSIS
+        return self.MOCK_ANALYSIS
+
+    def analysis_cache_key(self, readme_content: str) -> Optional[str]:
+        """
+        Content-addressed key for analyze_repo() results: model + hash of the
+        README text the prompt sees. None in mock mode (nothing worth caching).
+        """
+        if not self.model:
+            return None
+        digest = hashlib.blake2b(readme_content[:5000].encode("utf-8", "replace"), digest_size=16).hexdigest()
+        return f"{self.model_name}:{digest}"
 
     async def generate_strategy_v2(self, mission: Dict[str, Any], session_stats: Dict[str, Any], feedback_history: List[Dict[str, Any]], analytics_report: Dict[str, Any] = None) -> Dict[str, Any]:
         """Generate a new search strategy based on MISSION, Stats, and Feedback."""
@@ -272,16 +334,18 @@ class CloudBrain:
             "sort_by": "stars"
         }
 
-    async def generate_strategy(self, feedback_history: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate a new search strategy based on feedback."""
-        if self.model and feedback_history:
+    async def generate_strategy(self, feedback_summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a new search strategy based on aggregated feedback (see TunerStorage.get_feedback_aggregate)."""
+        if self.model and feedback_summary and feedback_summary.get("totals"):
             try:
-                history_str = json.dumps(feedback_history, indent=2)
+                summary_str = json.dumps(feedback_summary, indent=2)
                 prompt = f"""
-                Based on the following user feedback history for GitHub repositories, suggest a new search strategy.
+                Based on the following summary of user feedback on GitHub repositories, suggest a new search strategy.
+                "totals" counts votes per action; "top_terms" lists the most frequent terms
+                (and "lang:" languages) among the repositories the user liked or disliked.
 
-                History:
-                {history_str}
+                Feedback Summary:
+                {summary_str}
 
                 Return a JSON object with this structure:
                 {{
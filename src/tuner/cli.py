@@ -2,33 +2,34 @@
 import asyncio
 import sys
 import os
-import json
+import re
+import functools
 from pathlib import Path
-from typing import Optional, List
-from dotenv import load_dotenv
+from urllib.parse import urlsplit
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
 
 # Load environment variables from .env file
-load_dotenv()
+if not os.environ.get("TUNER_SKIP_DOTENV"):
+    from dotenv import load_dotenv
+    load_dotenv()
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
 
 # Add src to path for local imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tuner.hunter import Hunter
-from tuner.brain import LocalBrain, CloudBrain
-from tuner.storage import TunerStorage
-from tuner.tui import TunerDashboard, TuiLogHandler
-from tuner.manager import AutonomousManager
-from tuner.workers import WorkerManager
-from tuner.menu import main as menu_main
-from rich.live import Live
-import numpy as np
 import logging
 
+# Heavy modules (numpy, embeddings, TUI) are imported inside the commands that use them,
+# so `--version`, `list` etc. don't pay for them at startup.
+if TYPE_CHECKING:
+    import numpy as np
+    from tuner.brain import LocalBrain
+    from tuner.hunter import Hunter
+    from tuner.storage import TunerStorage
+
 HELP_TEXT = """
 # GitHub Tuner 🧬
 
@@ -60,11 +61,127 @@ DB_PATH = "data/tuner.db"
 STRATEGY_PATH = "strategy.json"
 USER_PROFILE_PATH = "data/user_profile.npy"
 
+# GitHub's owner/repo name rules
+_GH_OWNER = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})?")
+_GH_REPO = re.compile(r"[A-Za-z0-9_.-]{1,100}")
+
+def _parse_github_repo(url: str) -> Optional[Tuple[str, str]]:
+    """(owner, repo) from a github.com repo URL (query, fragment, .git and sub-paths ignored), or None."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or parts.hostname not in ("github.com", "www.github.com"):
+        return None
+    segments = parts.path.strip("/").split("/")
+    if len(segments) < 2:
+        return None
+    owner, repo = segments[0], segments[1].removesuffix(".git")
+    if not _GH_OWNER.fullmatch(owner) or not _GH_REPO.fullmatch(repo):
+        return None
+    return owner, repo
+
+# Shared storage for the current command (one persistent connection per process)
+_storage: Optional["TunerStorage"] = None
+
+async def _get_storage() -> "TunerStorage":
+    """Return the process-wide TunerStorage, creating and initializing it on first use."""
+    global _storage
+    if _storage is None:
+        from tuner.storage import TunerStorage
+
+        # One shared connection: TunerStorage applies the connection PRAGMAs once per process
+        storage = TunerStorage(DB_PATH, keep_connection=True)
+        await storage.initialize()
+        _storage = storage
+    return _storage
+
+# Shared GitHub clients keyed by strategy path (keeps the HTTP connection pool warm)
+_hunters: Dict[str, "Hunter"] = {}
+
+def _get_hunter(strategy_path: str = STRATEGY_PATH) -> "Hunter":
+    """Return the process-wide Hunter for strategy_path, creating it on first use."""
+    if strategy_path not in _hunters:
+        from tuner.hunter import Hunter
+        _hunters[strategy_path] = Hunter(strategy_path)
+    return _hunters[strategy_path]
+
+@functools.lru_cache(maxsize=1)
+def _get_local_brain() -> "LocalBrain":
+    """Process-wide LocalBrain, so the embedding model is loaded at most once."""
+    from tuner.brain import LocalBrain
+    return LocalBrain()
+
+async def _close_shared():
+    """Close the shared storage connection and HTTP clients."""
+    global _storage
+    if _storage is not None:
+        await _storage.close()
+        _storage = None
+    while _hunters:
+        _, hunter = _hunters.popitem()
+        await hunter.close()
+
+def _run(coro):
+    """
+    asyncio.run() a command, then close the shared resources on the same loop.
+    (aiosqlite's connection thread is non-daemon and httpx needs a live loop
+    to close, so doing this from atexit would be too late.)
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await _close_shared()
+    return asyncio.run(runner())
+
 def version_callback(value: bool):
     if value:
         console.print("[bold blue]GitHub Tuner[/bold blue] v0.3.0 (Phase 3)")
         raise typer.Exit()
 
+def _install_event_loop_policy():
+    """Use the selector loop on Windows and uvloop elsewhere when it is installed."""
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        return
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+def _start_logging(level: int, blocking_handlers: List[logging.Handler], direct_handlers: List[logging.Handler] = ()):
+    """
+    Replace the root handlers. blocking_handlers (file/stream I/O) run on a
+    QueueListener thread behind a QueueHandler so they never block the event
+    loop; direct_handlers (in-memory, e.g. the TUI) are attached as-is.
+    Returns the started listener; call .stop() on shutdown to flush it.
+    """
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in [*blocking_handlers, *direct_handlers]:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *blocking_handlers, respect_handler_level=True)
+    listener.start()
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+    for handler in direct_handlers:
+        root.addHandler(handler)
+    return listener
+
+def _enable_eager_tasks():
+    """Run new tasks eagerly until their first await (Python 3.12+; no-op before)."""
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
 @app.callback(invoke_without_command=True)
 def main(
     version: Optional[bool] = typer.Option(
@@ -75,33 +192,28 @@ def main(
     """
     GitHub Tuner: AI-powered repository discovery.
     """
+    # Runs before every subcommand, so all _run() calls pick it up
+    _install_event_loop_policy()
     if ctx.invoked_subcommand is None:
+        from tuner.menu import main as menu_main
         menu_main()
 
 @app.command()
 def agent():
     """Start the autonomous background agent (worker mode)."""
-    asyncio.run(_run_agent())
+    return _run(_run_agent())
 
 async def _run_agent():
+    from tuner.manager import AutonomousManager
+
+    _enable_eager_tasks()
     console.print(Panel.fit("[bold blue]GitHub Tuner[/bold blue] 👷 Starting Background Mission Agent..."))
 
-    # Configure Logging (Force Reconfigure)
-    root = logging.getLogger()
-    if root.handlers:
-        for handler in root.handlers[:]:
-            root.removeHandler(handler)
-    
-    root.setLevel(logging.DEBUG)
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-    
-    fh = logging.FileHandler("tuner.log", mode='a', encoding='utf-8')
-    fh.setFormatter(formatter)
-    root.addHandler(fh)
-    
-    sh = logging.StreamHandler()
-    sh.setFormatter(formatter)
-    root.addHandler(sh)
+    # Configure Logging (Force Reconfigure); file and console writes go through a queue
+    listener = _start_logging(logging.DEBUG, [
+        logging.FileHandler("tuner.log", mode='a', encoding='utf-8'),
+        logging.StreamHandler()
+    ])
 
     # Initialize Autonomous Manager (Supports Missions)
     manager = AutonomousManager(db_path=DB_PATH, strategy_path=STRATEGY_PATH, mission_path="missions.json")
@@ -114,13 +226,17 @@ async def _run_agent():
     except Exception as e:
         console.print(f"[red]Agent crashed: {e}[/red]")
         logging.exception("Agent crashed")
+    finally:
+        listener.stop()
 
 @app.command()
 def reset():
     """Reset the database (clear all findings and history)."""
-    asyncio.run(_reset_db())
+    return _run(_reset_db())
 
 async def _reset_db():
+    from tuner.storage import TunerStorage
+
     storage = TunerStorage(DB_PATH)
     console.print(Panel.fit("[bold red]GitHub Tuner[/bold red] 🗑️ Resetting Database..."))
     try:
@@ -132,33 +248,33 @@ async def _reset_db():
 @app.command()
 def init():
     """Initialize user profile by analyzing starred repos."""
-    asyncio.run(_init_profile())
+    return _run(_init_profile())
 
 async def _init_profile():
-    console.print(Panel.fit("[bold blue]GitHub Tuner[/bold blue] 🧬 Initializing User Profile..."))
+    import numpy as np
+    from tuner.profile import save_profile
 
-    hunter = Hunter(STRATEGY_PATH)
-    local_brain = LocalBrain()
+    console.print(Panel.fit("[bold blue]GitHub Tuner[/bold blue] 🧬 Initializing User Profile..."))
 
-    try:
-        with console.status("Fetching starred repositories...") as status:
-            descriptions = await hunter.fetch_user_starred_repos(limit=100)
-            status.update(f"Fetched {len(descriptions)} starred repos.")
+    hunter = _get_hunter(STRATEGY_PATH)
 
-        if not descriptions:
-            console.print("[yellow]No starred repos found or token missing. Skipping profile generation.[/yellow]")
-            return
+    with console.status("Fetching starred repositories...") as status:
+        descriptions = await hunter.fetch_user_starred_repos(limit=100, concurrency=10)
+        status.update(f"Fetched {len(descriptions)} starred repos.")
 
-        with console.status("Clustering interests...") as status:
-            clusters = local_brain.generate_interest_clusters(descriptions, k=5)
+    if not descriptions:
+        console.print("[yellow]No starred repos found or token missing. Skipping profile generation.[/yellow]")
+        return
 
-        # Save clusters (list of vectors)
-        os.makedirs(os.path.dirname(USER_PROFILE_PATH), exist_ok=True)
-        np.save(USER_PROFILE_PATH, np.array(clusters))
-        console.print(f"[green]Analyzed {len(descriptions)} starred repos. Identified {len(clusters)} interest clusters.[/green]")
+    with console.status("Clustering interests...") as status:
+        # One batched model call for all descriptions, then KMeans on the matrix
+        local_brain = _get_local_brain()
+        vectors = local_brain.vectorize_batch(descriptions)
+        clusters = local_brain.cluster(vectors, k=5)
 
-    finally:
-        await hunter.close()
+    # Save clusters (normalized float32 on disk)
+    save_profile(USER_PROFILE_PATH, np.array(clusters))
+    console.print(f"[green]Analyzed {len(descriptions)} starred repos. Identified {len(clusters)} interest clusters.[/green]")
 
 @app.command()
 def start(
@@ -166,33 +282,38 @@ def start(
     min_score: float = typer.Option(0.4, "--min-score", "-s", help="Minimum similarity score to trigger CloudBrain"),
 ):
     """Start the tuning process: Hunter -> Screener -> Analyst."""
-    asyncio.run(_run_tuning_loop(iterations, min_score))
+    return _run(_run_tuning_loop(iterations, min_score))
 
 async def _run_tuning_loop(iterations: int, min_score: float):
+    from rich.live import Live
+    from tuner.brain import CloudBrain
+    from tuner.tui import TunerDashboard, TuiLogHandler
+    from tuner.manager import AutonomousManager
+
+    _enable_eager_tasks()
     console.print(Panel.fit("[bold blue]GitHub Tuner[/bold blue] 🚀 Starting discovery engine..."))
 
-    storage = TunerStorage(DB_PATH)
-    await storage.initialize() # Ensure DB is ready
+    storage = await _get_storage() # Ensure DB is ready
 
-    hunter = Hunter(STRATEGY_PATH)
-    local_brain = LocalBrain()
+    # The manager runs its own Hunter; the brains are shared with it
+    local_brain = _get_local_brain()
     cloud_brain = CloudBrain()
 
     # Setup TUI
     dashboard = TunerDashboard(console)
     
-    # Configure Logging (File + TUI)
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.FileHandler("tuner.log", mode='a', encoding='utf-8'),
-            TuiLogHandler(dashboard)
-        ]
+    # Configure Logging (File via background queue listener + TUI in-memory)
+    listener = _start_logging(
+        logging.INFO,
+        [logging.FileHandler("tuner.log", mode='a', encoding='utf-8')],
+        [TuiLogHandler(dashboard)]
     )
     
-    # Initialize Autonomous Manager
-    manager = AutonomousManager(db_path=DB_PATH, strategy_path=STRATEGY_PATH, mission_path="missions.json")
+    # Initialize Autonomous Manager (sharing this process's brains)
+    manager = AutonomousManager(
+        db_path=DB_PATH, strategy_path=STRATEGY_PATH, mission_path="missions.json",
+        local_brain=local_brain, cloud_brain=cloud_brain
+    )
 
     with Live(dashboard, refresh_per_second=4, screen=True) as live:
         try:
@@ -217,7 +338,11 @@ async def _run_tuning_loop(iterations: int, min_score: float):
                 if manager.mission_control.current_mission:
                      dashboard.iteration_info = f"Mission: {manager.mission_control.current_mission.name}"
                 
-                await asyncio.sleep(0.5)
+                # Sleep until the manager reports new stats (or finishes); the timeout is a safety net
+                waiter = asyncio.ensure_future(manager.stats_changed.wait())
+                await asyncio.wait([mgr_task, waiter], return_when=asyncio.FIRST_COMPLETED, timeout=2.0)
+                waiter.cancel()
+                manager.stats_changed.clear()
             
             await mgr_task
             
@@ -229,6 +354,7 @@ async def _run_tuning_loop(iterations: int, min_score: float):
         finally:
             dashboard.update_status("Shutting down...")
             logging.getLogger().handlers = [] # Clear handlers
+            listener.stop()
 
     # Post-TUI Summary (Simplified for now as Manager runs indefinitely)
     console.print("\n[bold green]🚀 Session Complete[/bold green]")
@@ -239,31 +365,33 @@ def list(
     limit: int = typer.Option(10, "--limit", "-n", help="Number of findings to show"),
 ):
     """List pending findings."""
-    asyncio.run(_list_findings(limit))
+    return _run(_list_findings(limit))
 
 async def _list_findings(limit: int):
-    storage = TunerStorage(DB_PATH)
-    await storage.initialize()
-    try:
-        findings = await storage.get_pending_findings()
-
-        table = Table(title=f"Top Pending Findings ({len(findings)} total)")
-        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Score", style="magenta")
-        table.add_column("Title", style="bold")
-        table.add_column("Summary")
-
-        for f in findings[:limit]:
-            table.add_row(
-                str(f["id"]),
-                f"{f['match_score']:.2f}" if f['match_score'] else "N/A",
-                f"[link={f['url']}]{f['title']}[/link]",
-                f["ai_summary"][:100] + "..." if f["ai_summary"] else ""
-            )
-
-        console.print(table)
-    finally:
-        await storage.close()
+    from rich.style import Style
+    from rich.text import Text
+
+    storage = await _get_storage()
+    rows = await storage.get_pending_overview(limit, summary_chars=100)
+    total = await storage.count_findings("pending")
+
+    table = Table(title=f"Top Pending Findings ({total} total)")
+    table.add_column("ID", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Score", style="magenta", no_wrap=True)
+    table.add_column("Title", style="bold", no_wrap=True, overflow="ellipsis", max_width=40)
+    table.add_column("Summary", no_wrap=True, overflow="ellipsis", max_width=60)
+
+    # Text cells skip Rich's markup parsing; hyperlinks only make sense on a terminal
+    with_links = console.is_terminal
+    for f_id, score, url, title, summary in rows:
+        table.add_row(
+            str(f_id),
+            f"{score:.2f}" if score else "N/A",
+            Text(title, style=Style(link=url)) if with_links else Text(title),
+            Text(summary)
+        )
+
+    console.print(table)
 
 @app.command()
 def vote(
@@ -274,129 +402,173 @@ def vote(
     star_on_github: bool = typer.Option(False, "--star-on-github", help="Star the repo on GitHub if liked"),
 ):
     """Vote on a finding to train the agent."""
-    asyncio.run(_handle_vote(finding_id, vote, category, reason, star_on_github))
+    return _run(_handle_vote(finding_id, vote, category, reason, star_on_github))
 
 async def _handle_vote(finding_id: int, vote: str, category: str, reason: str, star_on_github: bool):
-    storage = TunerStorage(DB_PATH)
-    await storage.initialize()
-    local_brain = LocalBrain()
+    import numpy as np
+    from tuner.profile import load_profile, write_profile_rows
 
-    try:
-        action = "like" if vote.lower() in ["up", "like", "+1"] else "dislike"
-        status = "liked" if action == "like" else "disliked"
+    storage = await _get_storage()
+
+    action = "like" if vote.lower() in ["up", "like", "+1"] else "dislike"
+    status = "liked" if action == "like" else "disliked"
 
+    # One write transaction for the vote itself
+    async with storage.transaction():
         await storage.update_finding_status(finding_id, status)
         await storage.log_feedback(finding_id, action, category, reason)
+        finding = await storage.get_finding(finding_id)
 
-        console.print(f"[green]Voted {action} on finding {finding_id}.[/green]")
+    console.print(f"[green]Voted {action} on finding {finding_id}.[/green]")
 
-        # Dynamic Learning (Nudge)
-        if action == "like" and os.path.exists(USER_PROFILE_PATH):
-            try:
+    # Dynamic Learning (Nudge)
+    if action == "like":
+        try:
+            # Unit-length clusters, so similarity below is a plain dot product
+            clusters = load_profile(USER_PROFILE_PATH)
+            if clusters is not None and finding:
+                clusters = np.array(clusters)  # writable copy for the nudge
+                best_idx = _nudge_clusters(clusters, finding)
+                if best_idx != -1:
+                    write_profile_rows(USER_PROFILE_PATH, clusters, [best_idx])
+                    console.print(f"[blue]🧠 Brain updated: Interest cluster {best_idx} adjusted.[/blue]")
+        except Exception as e:
+            console.print(f"[red]Failed to update brain: {e}[/red]")
+
+    # GitHub call stays outside the transaction (no write lock held over a network RTT)
+    if action == "like" and star_on_github:
+        if finding and finding.get("url"):
+            # Parse owner/repo from URL (https://github.com/owner/repo)
+            url = finding["url"]
+            parsed = _parse_github_repo(url)
+            if not parsed:
+                console.print(f"[red]Invalid GitHub URL format: {url}[/red]")
+                return
+
+            owner, repo = parsed
+            hunter = _get_hunter()
+            if await hunter.star_repo(owner, repo):
+                 console.print(f"[green]Successfully starred {owner}/{repo} on GitHub![/green]")
+            else:
+                 console.print(f"[red]Failed to star {owner}/{repo} on GitHub.[/red]")
+        else:
+             console.print("[red]Could not determine repo URL for starring.[/red]")
+
+def _nudge_clusters(clusters: "np.ndarray", finding: dict) -> int:
+    """Move the closest interest cluster towards a liked finding (in place). Returns its index or -1."""
+    import numpy as np
+    from tuner.storage import decode_embedding
+
+    # Reuse the embedding stored at screening time; only old/foreign blobs need the model
+    blob = finding.get("embedding")
+    dtype = np.dtype(finding.get("embedding_dtype") or "float32")
+    if blob and len(blob) == clusters.shape[1] * dtype.itemsize:
+        desc_vec = decode_embedding(blob, dtype.name)
+    else:
+        desc_vec = _get_local_brain().vectorize(f"{finding['title']} {finding['description']}")
+
+    if len(clusters) == 0:
+        return -1
+
+    # Find closest cluster (clusters and desc_vec are unit-length, so one matmul gives all cosines)
+    sims = clusters @ desc_vec
+    best_idx = int(sims.argmax())
+
+    # Nudge cluster center towards new repo (Learning Rate: 0.1), in place
+    learning_rate = 0.1
+    row = clusters[best_idx]
+    row *= 1 - learning_rate
+    row += learning_rate * desc_vec
+    return best_idx
+
+@app.command("vote-many")
+def vote_many(
+    finding_ids: List[int] = typer.Argument(..., help="IDs of the findings"),
+    vote: str = typer.Option("up", "--vote", "-V", help="'up' (like) or 'down' (dislike)"),
+    category: str = typer.Option(None, "--category", "-c", help="Category: relevant_good, relevant_bad, irrelevant, off_topic"),
+    reason: str = typer.Option(None, "--reason", "-r", help="Free text reason for the votes"),
+):
+    """Vote on several findings at once (the interest profile is saved once at the end)."""
+    return _run(_handle_votes(finding_ids, vote, category, reason))
+
+async def _handle_votes(finding_ids: List[int], vote: str, category: str, reason: str):
+    import numpy as np
+    from tuner.profile import load_profile, write_profile_rows
+
+    storage = await _get_storage()
+
+    action = "like" if vote.lower() in ["up", "like", "+1"] else "dislike"
+    status = "liked" if action == "like" else "disliked"
+
+    clusters = load_profile(USER_PROFILE_PATH) if action == "like" else None
+    if clusters is not None:
+        clusters = np.array(clusters)  # writable copy for the nudge
+    adjusted = set()
+
+    async with storage.transaction():
+        for finding_id in finding_ids:
+            await storage.update_finding_status(finding_id, status)
+            await storage.log_feedback(finding_id, action, category, reason)
+
+            if clusters is not None:
                 finding = await storage.get_finding(finding_id)
                 if finding:
-                    # Reconstruct vector from title/desc (simplest way without decoding blob properly yet)
-                    # Ideally we store vector properly or decode blob
-                    desc_vec = local_brain.vectorize(f"{finding['title']} {finding['description']}")
-
-                    clusters = np.load(USER_PROFILE_PATH)
-                    if len(clusters.shape) == 1: clusters = clusters.reshape(1, -1)
-
-                    # Find closest cluster
-                    best_idx = -1
-                    max_sim = -1.0
-                    for i, c in enumerate(clusters):
-                        sim = local_brain.calculate_similarity(c, desc_vec)
-                        if sim > max_sim:
-                            max_sim = sim
-                            best_idx = i
-
+                    best_idx = _nudge_clusters(clusters, finding)
                     if best_idx != -1:
-                        # Nudge cluster center towards new repo (Learning Rate: 0.1)
-                        learning_rate = 0.1
-                        clusters[best_idx] = (1 - learning_rate) * clusters[best_idx] + learning_rate * desc_vec
-                        np.save(USER_PROFILE_PATH, clusters)
-                        console.print(f"[blue]🧠 Brain updated: Interest cluster {best_idx} adjusted.[/blue]")
-            except Exception as e:
-                console.print(f"[red]Failed to update brain: {e}[/red]")
-
-        if action == "like" and star_on_github:
-            finding = await storage.get_finding(finding_id)
-            if finding and finding.get("url"):
-                # Parse owner/repo from URL (https://github.com/owner/repo)
-                url = finding["url"]
-                try:
-                    # Remove .git suffix if present
-                    if url.endswith(".git"):
-                        url = url[:-4]
-
-                    parts = url.rstrip("/").split("/")
-                    if len(parts) >= 2:
-                        repo = parts[-1]
-                        owner = parts[-2]
-
-                        # Basic validation of owner/repo names
-                        if not owner or not repo or "." in owner: # Simple heuristic check
-                             console.print(f"[red]Could not parse valid owner/repo from URL: {url}[/red]")
-                             return
-
-                        hunter = Hunter()
-                        try:
-                            if await hunter.star_repo(owner, repo):
-                                 console.print(f"[green]Successfully starred {owner}/{repo} on GitHub![/green]")
-                            else:
-                                 console.print(f"[red]Failed to star {owner}/{repo} on GitHub.[/red]")
-                        finally:
-                            await hunter.close()
-                    else:
-                         console.print(f"[red]Invalid GitHub URL format: {url}[/red]")
-                except Exception as e:
-                     console.print(f"[red]Error parsing URL {url}: {e}[/red]")
-            else:
-                 console.print("[red]Could not determine repo URL for starring.[/red]")
-    finally:
-        await storage.close()
+                        adjusted.add(best_idx)
+
+    console.print(f"[green]Voted {action} on {len(finding_ids)} findings.[/green]")
+
+    if adjusted:
+        write_profile_rows(USER_PROFILE_PATH, clusters, adjusted)
+        console.print(f"[blue]🧠 Brain updated: Interest clusters {sorted(adjusted)} adjusted.[/blue]")
 
 @app.command()
 def report():
     """Show the Agent's Self-Learning Report Card."""
+    return _run(_show_report())
+
+async def _show_report():
     from tuner.analytics import AnalyticsEngine
+
+    # Nothing to aggregate on an empty database; skip the report queries
+    storage = await _get_storage()
+    if not await storage.any_findings():
+        console.print("[yellow]No findings yet. Run `start` first.[/yellow]")
+        return
+
+    engine = AnalyticsEngine(DB_PATH)
+    report = await engine.generate_report()
     
-    async def _show_report():
-        engine = AnalyticsEngine(DB_PATH)
-        report = await engine.generate_report()
-        
-        # 1. Yield Rates
-        yields = report["yield_rates"]
-        table = Table(title="📊 Performance Metrics")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="magenta")
-        table.add_row("Total Findings", str(yields['total_findings']))
-        table.add_row("AI Approved", f"{yields['ai_approved']} (Yield: {yields['ai_yield']:.1%})")
-        table.add_row("User Acceptance", f"{yields['user_acceptance_rate']:.1%}")
+    # 1. Yield Rates
+    yields = report["yield_rates"]
+    table = Table(title="📊 Performance Metrics")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="magenta")
+    table.add_row("Total Findings", str(yields['total_findings']))
+    table.add_row("AI Approved", f"{yields['ai_approved']} (Yield: {yields['ai_yield']:.1%})")
+    table.add_row("User Acceptance", f"{yields['user_acceptance_rate']:.1%}")
+    console.print(table)
+    
+    # 2. Rejection Analysis
+    rejected = report["rejection_analysis"]
+    if rejected["by_category"]:
+        table = Table(title="❌ Rejection Reasons")
+        table.add_column("Category", style="red")
+        table.add_column("Count", style="white")
+        for item in rejected["by_category"]:
+            table.add_row(item['category'] or "Uncategorized", str(item['count']))
         console.print(table)
         
-        # 2. Rejection Analysis
-        rejected = report["rejection_analysis"]
-        if rejected["by_category"]:
-            table = Table(title="❌ Rejection Reasons")
-            table.add_column("Category", style="red")
-            table.add_column("Count", style="white")
-            for item in rejected["by_category"]:
-                table.add_row(item['category'] or "Uncategorized", str(item['count']))
-            console.print(table)
-            
-        if rejected["common_reasons"]:
-            console.print("\n[bold red]📝 Common Complaints:[/bold red]")
-            for item in rejected["common_reasons"]:
-                 console.print(f"- {item['reason']} ({item['count']}x)")
-
-    asyncio.run(_show_report())
+    if rejected["common_reasons"]:
+        console.print("\n[bold red]📝 Common Complaints:[/bold red]")
+        for item in rejected["common_reasons"]:
+             console.print(f"- {item['reason']} ({item['count']}x)")
 
 @app.command()
 def optimize():
     """Optimize search strategy based on feedback."""
-    asyncio.run(_optimize_strategy())
+    return _run(_optimize_strategy())
 
 @app.command()
 def engineer(
@@ -414,32 +586,30 @@ def engineer(
     app.run()
 
 async def _optimize_strategy():
-    storage = TunerStorage(DB_PATH)
-    await storage.initialize()
+    from tuner.brain import CloudBrain
+    from tuner import fastjson
+
+    storage = await _get_storage()
     cloud_brain = CloudBrain()
 
-    try:
-        feedback = await storage.get_feedback_history()
-        if not feedback:
-            console.print("[yellow]No feedback history found. Vote on findings first![/yellow]")
-            return
+    feedback = await storage.get_feedback_aggregate()
+    if not feedback["totals"]:
+        console.print("[yellow]No feedback history found. Vote on findings first![/yellow]")
+        return
 
-        with console.status("Generating new strategy...") as status:
-            new_strategy = await cloud_brain.generate_strategy(feedback)
+    with console.status("Generating new strategy...") as status:
+        new_strategy = await cloud_brain.generate_strategy(feedback)
 
-        if new_strategy:
-            await storage.save_strategy(new_strategy)
-            # Update strategy.json
-            with open(STRATEGY_PATH, "w") as f:
-                json.dump(new_strategy, f, indent=4)
+    if new_strategy:
+        await storage.save_strategy(new_strategy)
+        # Update strategy.json
+        strategy_json = fastjson.dumps(new_strategy, indent=True)
+        with open(STRATEGY_PATH, "w") as f:
+            f.write(strategy_json)
 
-            console.print(Panel(json.dumps(new_strategy, indent=2), title="New Strategy Applied"))
-        else:
-            console.print("[red]Failed to generate new strategy.[/red]")
-    finally:
-        await storage.close()
+        console.print(Panel(strategy_json, title="New Strategy Applied"))
+    else:
+        console.print("[red]Failed to generate new strategy.[/red]")
 
 if __name__ == "__main__":
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     app()
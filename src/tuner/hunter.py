@@ -1,15 +1,28 @@
 import asyncio
-import json
 import logging
 import os
+import re
+import time
 import httpx
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, TYPE_CHECKING
 from dataclasses import dataclass
 
+from tuner import fastjson
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from tuner.storage import TunerStorage
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Import TacticEngine (optional, for when used with tactics)
 try:
     from tuner.tactics import TacticEngine, SearchTactic
@@ -17,6 +30,64 @@ except ImportError:
     TacticEngine = None
     SearchTactic = None
 
+# Parsed strategy files keyed by path -> ((st_mtime_ns, st_size), data)
+_STRATEGY_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+def load_strategy(strategy_path: str) -> Dict[str, Any]:
+    """Load a strategy file, re-parsing only when its mtime or size changes."""
+    st = os.stat(strategy_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _STRATEGY_CACHE.get(strategy_path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    with open(strategy_path, "rb") as f:
+        data = fastjson.loads(f.read())
+    _STRATEGY_CACHE[strategy_path] = (stamp, data)
+    return data
+
+_LINK_LAST = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+def _parse_last_page(link_header: str) -> Optional[int]:
+    """Extract the rel="last" page number from a GitHub Link header."""
+    match = _LINK_LAST.search(link_header or "")
+    return int(match.group(1)) if match else None
+
+# Cap on concurrent GitHub requests per Hunter (secondary rate limits kick in above ~10)
+MAX_CONCURRENT_REQUESTS = 8
+# Retries for rate-limited (403/429) responses, and the longest we'll wait for one
+RATE_LIMIT_RETRIES = 3
+MAX_BACKOFF_SECONDS = 60.0
+# READMEs larger than this are decoded in a worker thread instead of on the event loop
+README_THREAD_DECODE_BYTES = 32_768
+# Leading README text kept per finding; CloudBrain only reads the first 5000 chars anyway
+README_MAX_CHARS = 8192
+
+def _rate_limit_delay(resp: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying a rate-limited response, or None if the
+    response isn't a rate limit (e.g. a plain permission 403).
+    """
+    if resp.status_code not in (403, 429):
+        return None
+    headers = resp.headers
+    retry_after = headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), MAX_BACKOFF_SECONDS)
+        except ValueError:
+            pass
+    if headers.get("x-ratelimit-remaining") == "0":
+        try:
+            reset = float(headers.get("x-ratelimit-reset", ""))
+            return min(max(reset - time.time(), 1.0), MAX_BACKOFF_SECONDS)
+        except ValueError:
+            pass
+    elif resp.status_code == 403:
+        return None
+    # 429 (or exhausted quota without a usable reset): exponential backoff
+    return min(2.0 ** attempt, MAX_BACKOFF_SECONDS)
+
 @dataclass
 class RawFinding:
     title: str
@@ -27,9 +98,41 @@ class RawFinding:
     readme_content: str
 
 class Hunter:
-    def __init__(self, strategy_path: str = "strategy.json"):
+    def __init__(self, strategy_path: str = "strategy.json", storage: Optional["TunerStorage"] = None):
         self.strategy_path = strategy_path
-        self.client = httpx.AsyncClient(headers={"User-Agent": "GitHub-Tuner/1.0"}, follow_redirects=True, timeout=30.0)
+        # Optional: enables the ETag README cache
+        self.storage = storage
+        # README fan-out hits one host: keep connections alive (and multiplex over HTTP/2
+        # when available) instead of paying a TLS handshake per request
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": "GitHub-Tuner/1.0"},
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(10.0, connect=5.0)
+        )
+        # Shared by every request this Hunter makes, however many tasks fan out. Created on
+        # the first request: the Hunter may be built outside the loop that uses it
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Issue a GET/PUT through the shared concurrency cap, retrying
+        rate-limited responses after Retry-After / X-RateLimit-Reset.
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        send = self.client.get if method == "GET" else self.client.put
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with self._sem:
+                resp = await send(url, **kwargs)
+            delay = _rate_limit_delay(resp, attempt) if attempt < RATE_LIMIT_RETRIES else None
+            if delay is None:
+                return resp
+            # Sleep outside the semaphore so other requests keep their slots
+            logger.warning(f"GitHub rate limit ({resp.status_code}) on {url}; retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+        return resp
 
     async def close(self):
         await self.client.aclose()
@@ -37,8 +140,7 @@ class Hunter:
     def _load_strategy(self) -> Dict[str, Any]:
         """Load the search strategy."""
         try:
-            with open(self.strategy_path, "r") as f:
-                return json.load(f)
+            return load_strategy(self.strategy_path)
         except FileNotFoundError:
             logger.warning(f"Strategy file {self.strategy_path} not found. Using default.")
             return {
@@ -61,7 +163,7 @@ class Hunter:
             if token:
                 headers["Authorization"] = f"token {token}"
 
-            resp = await self.client.get(url, headers=headers)
+            resp = await self._request("GET", url, headers=headers)
 
             # We return headers so the RateLimitMonitor can track them
             return resp.json().get("items", []), dict(resp.headers)
@@ -74,7 +176,8 @@ class Hunter:
         """Legacy synchronous-style search (for CLI compatibility)."""
         logger.warning("Using legacy search_github. Switching to workers recommended.")
 
-        strategy = self._load_strategy()
+        # File I/O off the event loop (cached after the first read)
+        strategy = await asyncio.to_thread(self._load_strategy)
         keywords = strategy.get("keywords", [])
         languages = strategy.get("languages", [])
         min_stars = strategy.get("min_stars", 50)
@@ -91,11 +194,8 @@ class Hunter:
 
         items, _ = await self.search_raw(query, page=page)
 
-        findings = []
-        for item in items:
-            findings.append(await self._process_item(item))
-
-        return findings
+        # All README fetches in flight at once
+        return await self._process_page(items)
 
     async def search_for_mission(self, mission_goal: str, languages: List[str], min_stars: int = 50) -> List[RawFinding]:
         """
@@ -182,11 +282,7 @@ class Hunter:
         
         logger.info(f"📦 Found {len(items)} items, {len(active_items)} active (non-archived, recent)")
         
-        findings = []
-        for item in active_items:
-            findings.append(await self._process_item(item))
-        
-        return findings
+        return await self._process_page(active_items)
 
     async def search_with_tactic(
         self, 
@@ -201,6 +297,27 @@ class Hunter:
         
         Returns: (findings, query_used)
         """
+        items, query = await self.find_tactic_items(mission_goal, languages, tactic, tactic_engine, ai_keywords)
+
+        findings = []
+        async for finding in self.iter_findings(items):
+            findings.append(finding)
+
+        return findings, query
+
+    async def find_tactic_items(
+        self,
+        mission_goal: str,
+        languages: List[str],
+        tactic: 'SearchTactic',
+        tactic_engine: 'TacticEngine' = None,
+        ai_keywords: List[str] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Run the tactic search and drop archived/stale repos, without fetching READMEs.
+
+        Returns: (active_items, query_used)
+        """
         from datetime import datetime, timedelta
         
         # Build query using tactic engine or fallback
@@ -251,16 +368,60 @@ class Hunter:
         
         logger.info(f"📦 Tactic {tactic.name}: {len(items)} total, {len(active_items)} active")
         
-        findings = []
-        for item in active_items:
-            findings.append(await self._process_item(item))
-        
-        return findings, query
+        return active_items, query
 
+    async def iter_findings(self, items: List[Dict[str, Any]]) -> AsyncIterator[RawFinding]:
+        """
+        Yield a RawFinding per search item as soon as its README is fetched.
+        All fetches start up front, so findings arrive in completion order.
+        """
+        page_cache, pending = await self._load_readme_cache(items), []
+        tasks = [asyncio.ensure_future(self._process_item(item, page_cache, pending)) for item in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early (or failed): don't leave fetches running
+            for task in tasks:
+                task.cancel()
+            await self._store_readmes(pending)
+
+    async def _process_page(self, items: List[Dict[str, Any]]) -> List[RawFinding]:
+        """RawFindings for a page of search items, in order, with one README cache read and write."""
+        page_cache, pending = await self._load_readme_cache(items), []
+        try:
+            return list(await asyncio.gather(*[self._process_item(item, page_cache, pending) for item in items]))
+        finally:
+            await self._store_readmes(pending)
+
+    @staticmethod
+    def _readme_key(item: Dict[str, Any]) -> str:
+        return f"{item['owner']['login']}/{item['name']}/{item['default_branch']}"
+
+    async def _load_readme_cache(self, items: List[Dict[str, Any]]) -> Optional[Dict[str, tuple]]:
+        """Cached READMEs of a page of items in one query (None without storage)."""
+        if not self.storage:
+            return None
+        try:
+            return await self.storage.get_cached_readmes([self._readme_key(item) for item in items])
+        except Exception as e:
+            logger.warning(f"README cache lookup failed: {e}")
+            return {}
 
-    async def _process_item(self, item: Dict[str, Any]) -> RawFinding:
+    async def _store_readmes(self, pending: List[tuple]):
+        """Write the READMEs fetched for a page to the cache in one statement."""
+        if not pending:
+            return
+        try:
+            await self.storage.cache_readmes(pending)
+        except Exception as e:
+            logger.warning(f"Failed to cache {len(pending)} READMEs: {e}")
+
+    async def _process_item(self, item: Dict[str, Any], page_cache: Optional[Dict[str, tuple]] = None,
+                            pending: Optional[List[tuple]] = None) -> RawFinding:
         """Fetch readme and create RawFinding object."""
-        readme = await self._fetch_readme(item["owner"]["login"], item["name"], item["default_branch"])
+        readme = await self._fetch_readme(item["owner"]["login"], item["name"], item["default_branch"],
+                                          page_cache, pending)
         return RawFinding(
             title=item["full_name"],
             url=item["html_url"],
@@ -270,24 +431,89 @@ class Hunter:
             readme_content=readme
         )
 
-    async def _fetch_readme(self, owner: str, repo: str, branch: str) -> str:
-        """Fetch README raw content."""
+    async def _fetch_readme(self, owner: str, repo: str, branch: str,
+                            page_cache: Optional[Dict[str, tuple]] = None,
+                            pending: Optional[List[tuple]] = None) -> str:
+        """
+        Fetch README raw content.
+        With storage, a README seen before is revalidated with one If-None-Match
+        request (304 = reuse the cached body). Otherwise all candidate filenames
+        are probed concurrently; the first one in preference order that exists
+        wins and the remaining probes are cancelled.
+        page_cache/pending come from a page-level lookup (see _process_page);
+        without them the cache is read and written for this README alone.
+        """
+        key = f"{owner}/{repo}/{branch}"
+        if self.storage:
+            try:
+                if page_cache is None:
+                    cached = await self.storage.get_cached_readme(key)
+                else:
+                    cached = page_cache.get(key)
+                if cached:
+                    url, etag, body = cached
+                    resp = await self._request("GET", url, headers={"If-None-Match": etag})
+                    if resp.status_code == 304:
+                        return body
+                    if resp.status_code == 200:
+                        return await self._remember_readme(key, url, resp, pending)
+                    # Gone or renamed: probe again
+            except Exception as e:
+                logger.warning(f"README cache lookup failed for {key}: {e}")
+
         # Try common README filenames
         filenames = ["README.md", "readme.md", "README.rst", "README.txt"]
 
-        for fname in filenames:
+        async def _probe(fname: str) -> Optional[Tuple[str, httpx.Response]]:
             url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{fname}"
             try:
-                resp = await self.client.get(url)
+                resp = await self._request("GET", url)
                 if resp.status_code == 200:
-                    return resp.text
+                    return url, resp
             except Exception:
-                continue
+                pass
+            return None
+
+        probes = [asyncio.ensure_future(_probe(fname)) for fname in filenames]
+        try:
+            for probe in probes:
+                hit = await probe
+                if hit is not None:
+                    return await self._remember_readme(key, *hit, pending)
+        finally:
+            for probe in probes:
+                probe.cancel()
 
         return ""
 
-    async def fetch_user_starred_repos(self, limit: int = 100) -> List[str]:
-        """Fetches descriptions of repos starred by the authenticated user."""
+    async def _remember_readme(self, key: str, url: str, resp: httpx.Response,
+                               pending: Optional[List[tuple]] = None) -> str:
+        """
+        Body of a 200 README response (truncated), cached with its ETag when storage is set.
+        With pending, the cache row is queued there for the page's single write.
+        """
+        raw = resp.content
+        if len(raw) > README_THREAD_DECODE_BYTES:
+            body = await asyncio.to_thread(raw.decode, resp.encoding or "utf-8", "replace")
+        else:
+            body = resp.text
+        body = body[:README_MAX_CHARS]
+        etag = resp.headers.get("etag") if self.storage else None
+        if etag and pending is not None:
+            pending.append((key, url, etag, body))
+        elif etag:
+            try:
+                await self.storage.cache_readme(key, url, etag, body)
+            except Exception as e:
+                logger.warning(f"Failed to cache README for {key}: {e}")
+        return body
+
+    async def fetch_user_starred_repos(self, limit: int = 100, concurrency: int = 10) -> List[str]:
+        """
+        Fetches descriptions of repos starred by the authenticated user.
+        The first page tells us how many pages exist (Link rel="last"); the
+        rest are fetched concurrently, at most `concurrency` at a time.
+        """
         token = os.getenv("GITHUB_TOKEN")
         if not token:
             logger.warning("No GITHUB_TOKEN found. Cannot fetch user stars.")
@@ -295,43 +521,61 @@ class Hunter:
 
         headers = {"Authorization": f"token {token}", "Accept": "application/vnd.github.v3+json"}
         url = "https://api.github.com/user/starred"
+        # Same page size on every page keeps pagination offsets consistent;
+        # below 100 a single right-sized page covers the limit
+        per_page = max(1, min(100, limit))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch_page(page: int):
+            params = {
+                "per_page": per_page,
+                "sort": "created",
+                "direction": "desc",
+                "page": page
+            }
+            async with semaphore:
+                resp = await self._request("GET", url, headers=headers, params=params)
+            resp.raise_for_status()
+            return resp
 
         descriptions = []
-        page = 1
 
-        try:
-            while len(descriptions) < limit:
-                # Always fetch 100 per page to maintain consistent pagination offsets
-                params = {
-                    "per_page": 100,
-                    "sort": "created",
-                    "direction": "desc",
-                    "page": page
-                }
-
-                resp = await self.client.get(url, headers=headers, params=params)
-                resp.raise_for_status()
-                repos = resp.json()
-
-                if not repos:
-                    break
+        def _collect(repos) -> bool:
+            """Append repo texts; returns False once the limit is reached."""
+            for repo in repos:
+                if len(descriptions) >= limit:
+                    return False
 
-                for repo in repos:
-                    if len(descriptions) >= limit:
-                        break
+                desc = repo.get("description") or ""
+                title = repo.get("full_name") or ""
+                # Combine title and description for better context
+                text = f"{title} {desc}".strip()
+                if text:
+                    descriptions.append(text)
+            return len(descriptions) < limit
 
-                    desc = repo.get("description") or ""
-                    title = repo.get("full_name") or ""
-                    # Combine title and description for better context
-                    text = f"{title} {desc}".strip()
-                    if text:
-                        descriptions.append(text)
-
-                if len(repos) < 100:
+        try:
+            first = await _fetch_page(1)
+            repos = first.json()
+            if not _collect(repos) or len(repos) < per_page:
+                return descriptions
+
+            wanted_pages = -(-limit // per_page)
+            last_page = _parse_last_page(first.headers.get("link", ""))
+            n_pages = min(wanted_pages, last_page) if last_page else wanted_pages
+
+            results = await asyncio.gather(
+                *[_fetch_page(p) for p in range(2, n_pages + 1)],
+                return_exceptions=True
+            )
+            # Consume pages in order and stop at the first failure or short page
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+                repos = result.json()
+                if not repos or not _collect(repos) or len(repos) < per_page:
                     break
 
-                page += 1
-
             return descriptions
 
         except Exception as e:
@@ -353,7 +597,7 @@ class Hunter:
         url = f"https://api.github.com/user/starred/{owner}/{repo}"
 
         try:
-            resp = await self.client.put(url, headers=headers)
+            resp = await self._request("PUT", url, headers=headers)
             if resp.status_code == 204:
                 logger.info(f"Successfully starred {owner}/{repo}")
                 return True
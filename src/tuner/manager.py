@@ -1,13 +1,17 @@
 import asyncio
+import contextlib
 import logging
-import json
+import os
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 
 from tuner.hunter import Hunter
 from tuner.brain import LocalBrain, CloudBrain
-from tuner.storage import TunerStorage
+from tuner.storage import TunerStorage, encode_embedding
+from tuner.profile import load_profile
+from tuner.simd_kernels import max_similarity
+from tuner import fastjson
 from tuner.mission import MissionControl
 from tuner.analytics import AnalyticsEngine
 from tuner.tactics import TacticEngine
@@ -16,6 +20,28 @@ from tuner.mission_initializer import MissionInitializer
 
 logger = logging.getLogger(__name__)
 
+# Research cycle pipeline tuning
+PIPELINE_QUEUE_SIZE = 64
+SCREEN_BATCH_SIZE = 32
+# Shorter "title description" texts embed as noise: filtered without an embedding
+MIN_SCREEN_TEXT_CHARS = 20
+PROFILE_PATH = "data/user_profile.npy"
+# Reuse a cached AI analysis of the same README for this long
+ANALYSIS_CACHE_TTL = 30 * 24 * 3600
+# How long a mission's average tactic success rate is reused by AdaptiveThresholds
+THRESHOLD_CACHE_TTL = 60.0
+_PIPELINE_DONE = object()  # Queue sentinel: no more items
+
+
+def _matches_mission(item: Dict[str, Any], mission) -> bool:
+    """Whether a search result meets the mission's min_stars and language list ("Any" matches all)."""
+    if (item.get("stargazers_count") or 0) < (mission.min_stars or 0):
+        return False
+    languages = {lang.lower() for lang in mission.languages or []}
+    if not languages or "any" in languages:
+        return True
+    return (item.get("language") or "").lower() in languages
+
 
 class AdaptiveThresholds:
     """
@@ -30,6 +56,23 @@ class AdaptiveThresholds:
             "ai_analysis_threshold": 0.4,
         }
         self._cache: Dict[str, Dict[str, float]] = {}
+        # mission -> (monotonic timestamp, average tactic success rate or None)
+        self._avg_cache: Dict[str, Tuple[float, Optional[float]]] = {}
+
+    async def _avg_success(self, mission_name: str) -> Optional[float]:
+        """Average tactic success rate of the mission, memoized for THRESHOLD_CACHE_TTL."""
+        cached = self._avg_cache.get(mission_name)
+        if cached and time.monotonic() - cached[0] < THRESHOLD_CACHE_TTL:
+            return cached[1]
+
+        success_rates = await self.storage.get_tactic_success_rates(mission_name)
+        avg = sum(success_rates.values()) / len(success_rates) if success_rates else None
+        self._avg_cache[mission_name] = (time.monotonic(), avg)
+        return avg
+
+    def invalidate(self, mission_name: str):
+        """Drop the memoized success rate after new tactic performance was logged."""
+        self._avg_cache.pop(mission_name, None)
     
     async def get_threshold(self, mission_name: str, key: str) -> float:
         """Return dynamic threshold per mission."""
@@ -39,10 +82,8 @@ class AdaptiveThresholds:
         
         # Calculate from performance data
         try:
-            success_rates = await self.storage.get_tactic_success_rates(mission_name)
-            if success_rates:
-                avg_success = sum(success_rates.values()) / len(success_rates)
-                
+            avg_success = await self._avg_success(mission_name)
+            if avg_success is not None:
                 # Lower threshold on low success, raise on high success
                 if key == "similarity_threshold":
                     # If success is low, let more repos through
@@ -70,15 +111,17 @@ class AdaptiveThresholds:
 
 
 class AutonomousManager:
-    def __init__(self, db_path="data/tuner.db", strategy_path="strategy.json", mission_path="mission.json"):
+    def __init__(self, db_path="data/tuner.db", strategy_path="strategy.json", mission_path="mission.json",
+                 local_brain: LocalBrain = None, cloud_brain: CloudBrain = None):
         self.db_path = db_path
         self.strategy_path = strategy_path
         self.mission_path = mission_path
         
         self.storage = TunerStorage(db_path)
         self.mission_control = MissionControl(mission_path)
-        self.cloud_brain = CloudBrain()
-        self.local_brain = LocalBrain()
+        # Brains can be shared with the caller (loading the embedding model is slow)
+        self.cloud_brain = cloud_brain or CloudBrain()
+        self.local_brain = local_brain or LocalBrain()
         self.analytics = AnalyticsEngine(db_path)
         self.tactic_engine = TacticEngine(self.storage)
         self.thresholds = AdaptiveThresholds(self.storage)
@@ -86,6 +129,8 @@ class AutonomousManager:
         # New Autonomous Components
         self.ai_evolver = SafeAITacticEvolver(self.storage, self.cloud_brain)
         self.mission_initializer = None # Init in start() or later because it needs hunter
+        # One Hunter (and its pooled HTTP client) for the manager's lifetime
+        self._hunter = None
 
         
         # Runtime State
@@ -93,8 +138,14 @@ class AutonomousManager:
         self.session_stats = {
             "scanned": 0,
             "interested": 0,
+            "prefiltered": 0,
             "start_time": 0
         }
+        # Set whenever session_stats or the current mission change (UI refresh trigger)
+        self.stats_changed = asyncio.Event()
+        # URLs already in the findings table, loaded once and kept in sync by
+        # the screener, so known repos are dropped before any README fetch
+        self._known_urls = None
         self._cycle_count = 0
         self._ai_optimization_interval = 50  # Her 50 döngüde bir AI kullan
     
@@ -112,8 +163,7 @@ class AutonomousManager:
         
         # Init components needing Hunter
         if not self.mission_initializer:
-            temp_hunter = Hunter(self.strategy_path)
-            self.mission_initializer = MissionInitializer(self.mission_control, temp_hunter, self.cloud_brain)
+            self.mission_initializer = MissionInitializer(self.mission_control, self._get_hunter(), self.cloud_brain)
             
         try:
             while self.running:
@@ -123,6 +173,7 @@ class AutonomousManager:
                 # 1. Load Context & Cycle Mission
                 self.mission_control.load_missions() # Refresh from file potentially
                 mission = self.mission_control.next_mission()
+                self.stats_changed.set()
                 
                 if not mission:
                     logger.warning("No missions found. Sleeping.")
@@ -144,13 +195,24 @@ class AutonomousManager:
             logger.error(f"Manager crashed: {e}")
         finally:
             self.running = False
+            if self._hunter:
+                await self._hunter.close()
+                # The initializer holds the same Hunter; rebuild both on the next start()
+                self._hunter = None
+                self.mission_initializer = None
             await self.storage.close()
 
+    def _get_hunter(self) -> Hunter:
+        """Shared Hunter, so connections stay warm across research cycles."""
+        if self._hunter is None:
+            self._hunter = Hunter(self.strategy_path, storage=self.storage)
+        return self._hunter
+
     async def run_research_cycle(self, mission):
         """Run the Hunter -> Screener loop with TacticEngine."""
         logger.info(f"🎯 Starting Research Cycle for Mission: {mission.name}")
         
-        hunter = Hunter(self.strategy_path)
+        hunter = self._get_hunter()
         
         # Load tactic performance data
         perf_data = await self.storage.get_tactic_success_rates(mission.name)
@@ -168,14 +230,22 @@ class AutonomousManager:
         results_rejected = 0
         query_used = ""
         
+        # Profile read (and the goal-embedding fallback) run in a worker thread,
+        # overlapping the search request instead of blocking the event loop
+        clusters_task = asyncio.ensure_future(asyncio.to_thread(self._interest_matrix, mission))
+        # First cycle: the known-URL set is read from the DB during the search as well
+        known_task = None
+        if self._known_urls is None:
+            known_task = asyncio.ensure_future(self.storage.get_known_urls())
+
         try:
             # Extract AI keywords for repo-based search
             ai_keywords = None
             if mission.ai_strategy and "keywords" in mission.ai_strategy:
                 ai_keywords = mission.ai_strategy["keywords"]
                 
-            # Search with tactic
-            findings, query_used = await hunter.search_with_tactic(
+            # Search with tactic (READMEs are fetched later, while screening runs)
+            items, query_used = await hunter.find_tactic_items(
                 mission_goal=mission.goal,
                 languages=mission.languages,
                 tactic=tactic,
@@ -183,68 +253,161 @@ class AutonomousManager:
                 ai_keywords=ai_keywords
             )
             
-            results_found = len(findings)
+            results_found = len(items)
+
+            # Duplicates would only be rejected by the DB after fetch + embed
+            if known_task is not None:
+                self._known_urls = await known_task
+            new_items = [item for item in items if item["html_url"] not in self._known_urls]
+            if len(new_items) < len(items):
+                logger.info(f"⏭️ Skipping {len(items) - len(new_items)} already known repos")
+            items = new_items
+
+            # Mission star/language limits are cheap: apply them before any README fetch or embedding
+            matching = [item for item in items if _matches_mission(item, mission)]
+            if len(matching) < len(items):
+                prefiltered = len(items) - len(matching)
+                logger.info(f"⏭️ Skipping {prefiltered} repos outside the mission's stars/languages")
+                self.session_stats["prefiltered"] += prefiltered
+                results_rejected += prefiltered
+            items = matching
             
-            # Load user profile for screening
-            profile_path = "data/user_profile.npy" 
-            interest_clusters = []
-            try:
-                if import_os_exists(profile_path):
-                    interest_clusters = np.load(profile_path)
-                    if len(interest_clusters.shape) == 1: 
-                        interest_clusters = interest_clusters.reshape(1, -1)
-            except:
-                pass
-                
-            if len(interest_clusters) == 0:
-                # Use mission goal as vector
-                msg = f"{mission.goal} {' '.join(mission.languages)}"
-                interest_clusters = [self.local_brain.vectorize(msg)]
-
-            # Screen findings
-            for finding in findings:
-                self.session_stats["scanned"] += 1
-                
-                # Vector similarity check
-                desc_vec = self.local_brain.vectorize(f"{finding.title} {finding.description}")
-                max_sim = 0.0
-                for c in interest_clusters:
-                    sim = self.local_brain.calculate_similarity(c, desc_vec)
-                    if sim > max_sim: max_sim = sim
-                
-                # Save to DB
-                f_id = await self.storage.save_finding(
-                    finding.title, finding.url, finding.description, 
-                    finding.stars, finding.language, desc_vec.tobytes()
-                )
-                
-                if f_id != -1:  # Not duplicate
-                    if max_sim >= threshold:
-                        # High signal -> Analyze with AI (minimal usage)
-                        summary, relevance = "Auto-Accepted", max_sim
-                        
-                        # AI analizi sadece yüksek belirsizlik durumunda
-                        if 0.3 <= max_sim <= 0.5:  # Belirsiz alan
-                            try:
-                                logger.info(f"🧠 AI analyzing uncertain case: {finding.title}")
-                                summary, ai_score = await self.cloud_brain.analyze_repo(finding.readme_content)
-                                final_score = (max_sim + ai_score) / 2
-                            except Exception as e:
-                                logger.error(f"AI analysis failed: {e}")
-                                final_score = max_sim
+            # (k, dim) float32 matrix of unit rows to screen against
+            clusters_mat = await clusters_task
+
+            # Pipeline: Hunter (README fetch) -> Screener (vectors + DB) -> Analyst (cloud AI)
+            raw_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+            analyze_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+            async def hunter_stage():
+                try:
+                    async for finding in hunter.iter_findings(items):
+                        await raw_q.put(finding)
+                finally:
+                    await raw_q.put(_PIPELINE_DONE)
+
+            async def screener_stage():
+                nonlocal results_accepted, results_rejected
+                done = False
+                while not done:
+                    # Take whatever is ready (up to a batch) in one go
+                    batch = [await raw_q.get()]
+                    while len(batch) < SCREEN_BATCH_SIZE and not raw_q.empty():
+                        batch.append(raw_q.get_nowait())
+                    if batch[-1] is _PIPELINE_DONE:
+                        batch.pop()
+                        done = True
+
+                    if not batch:
+                        continue
+
+                    # Columns of the batch, read once: the embedding call and the bulk insert
+                    # both walk these instead of re-reading each finding's attributes
+                    titles = [f.title for f in batch]
+                    urls = [f.url for f in batch]
+                    descriptions = [f.description for f in batch]
+                    stars = [f.stars for f in batch]
+                    languages = [f.language for f in batch]
+
+                    # Vector similarity check: one embedding call and one max-similarity pass per batch,
+                    # skipping texts too short to embed meaningfully (they stay at similarity 0)
+                    texts = [f"{title} {desc}".strip() for title, desc in zip(titles, descriptions)]
+                    embed_idx = [i for i, text in enumerate(texts) if len(text) >= MIN_SCREEN_TEXT_CHARS]
+                    vectors = np.zeros((len(batch), clusters_mat.shape[1]), dtype=np.float32)
+                    if embed_idx:
+                        vectors[embed_idx] = self.local_brain.vectorize_batch([texts[i] for i in embed_idx])
+                    batch_sims = np.maximum(max_similarity(vectors, clusters_mat), 0.0)
+                    embedded = np.zeros(len(batch), dtype=bool)
+                    embedded[embed_idx] = True
+
+                    self.session_stats["scanned"] += len(batch)
+
+                    # Decide before saving, so each row is written once with its verdict
+                    verdicts = []  # (summary, score), or None for uncertain cases
+                    for max_sim, has_vec in zip(batch_sims, embedded):
+                        max_sim = float(max_sim)
+                        if has_vec and max_sim >= threshold:
+                            # AI analizi sadece yüksek belirsizlik durumunda
+                            if 0.3 <= max_sim <= 0.5:  # Belirsiz alan
+                                verdicts.append(None)
+                            else:
+                                verdicts.append(("Auto-Accepted", max_sim))
                         else:
-                            final_score = max_sim
-                        
-                        await self.storage.update_finding_analysis(f_id, summary, final_score)
-                        self.session_stats["interested"] += 1
+                            # Low signal - filtered
+                            verdicts.append(("Filtered", max_sim))
+
+                    # Save to DB: one transaction for the whole batch
+                    blobs = [encode_embedding(vec) if has_vec else None for vec, has_vec in zip(vectors, embedded)]
+                    f_ids = await self.storage.save_findings_bulk([
+                        (*row, *(verdict or (None, None)))
+                        for row, verdict in zip(zip(titles, urls, descriptions, stars, languages, blobs), verdicts)
+                    ])
+
+                    self._known_urls.update(urls)
+
+                    accepted = []
+                    for finding, f_id, max_sim, verdict in zip(batch, f_ids, batch_sims, verdicts):
+                        if f_id == -1:  # Duplicate
+                            continue
+                        if verdict is None:
+                            await analyze_q.put((f_id, finding, float(max_sim)))
+                        elif verdict[0] == "Filtered":
+                            results_rejected += 1
+                        else:
+                            accepted.append((f_id, finding, *verdict))
+
+                    self._count_accepted(accepted)
+                    results_accepted += len(accepted)
+
+                    self.stats_changed.set()
+
+                await analyze_q.put(_PIPELINE_DONE)
+
+            async def analyst_stage():
+                # A fixed pool of consumers: a job leaves analyze_q only when one is free,
+                # so a full queue holds the screener back
+                async def consume():
+                    nonlocal results_accepted
+                    while True:
+                        job = await analyze_q.get()
+                        if job is _PIPELINE_DONE:
+                            # Leave it for the other consumers
+                            await analyze_q.put(_PIPELINE_DONE)
+                            return
+                        f_id, finding, max_sim = job
+                        try:
+                            summary, ai_score = await self._analyze_readme(finding)
+                            final_score = (max_sim + ai_score) / 2
+                        except Exception as e:
+                            logger.error(f"AI analysis failed: {e}")
+                            summary, final_score = "Auto-Accepted", max_sim
+                        await self._accept_finding(f_id, finding, summary, final_score)
                         results_accepted += 1
-                        logger.info(f"✅ Inbox +1: {finding.title} (Score: {final_score:.2f})")
-                    else:
-                        # Low signal - filtered
-                        await self.storage.update_finding_analysis(f_id, "Filtered", max_sim)
-                        results_rejected += 1
+
+                await asyncio.gather(*[consume() for _ in range(max(1, self.cloud_brain.max_concurrency))])
+
+            stages = [
+                asyncio.create_task(hunter_stage()),
+                asyncio.create_task(screener_stage()),
+                asyncio.create_task(analyst_stage()),
+            ]
+            try:
+                await asyncio.gather(*stages)
+            except BaseException:
+                # One stage failed: the others would block on their queues forever
+                for stage in stages:
+                    stage.cancel()
+                raise
 
         finally:
+            # Early exit (search failed): stop the prefetches and retrieve their results, so one
+            # that already failed isn't reported as never retrieved (the profile thread itself
+            # runs to completion; only its task is cancelled)
+            for task in (clusters_task, known_task):
+                if task is not None:
+                    task.cancel()
+                    with contextlib.suppress(Exception, asyncio.CancelledError):
+                        await task
             # Log tactic performance
             await self.storage.log_tactic_performance(
                 mission_name=mission.name,
@@ -254,13 +417,77 @@ class AutonomousManager:
                 results_accepted=results_accepted,
                 results_rejected=results_rejected
             )
+            self.thresholds.invalidate(mission.name)
             
             # Update tactic weight based on success
             if results_found > 0:
                 success_rate = results_accepted / results_found
                 self.tactic_engine.update_tactic_weight(tactic.name, success_rate)
-            
-            await hunter.close()
+
+    async def _analyze_readme(self, finding) -> tuple:
+        """CloudBrain analysis of a finding's README, served from the analysis cache when possible."""
+        key = self.cloud_brain.analysis_cache_key(finding.readme_content)
+        if key:
+            cached = await self.storage.get_cached_analysis(key, ANALYSIS_CACHE_TTL)
+            if cached:
+                logger.info(f"🧠 Reusing cached AI analysis: {finding.title}")
+                return cached
+
+        logger.info(f"🧠 AI analyzing uncertain case: {finding.title}")
+        result = await self.cloud_brain.analyze_repo(finding.readme_content)
+        if key and result not in (CloudBrain.RATE_LIMITED_ANALYSIS, CloudBrain.MOCK_ANALYSIS):
+            await self.storage.cache_analysis(key, *result)
+        return result
+
+    def _interest_matrix(self, mission) -> np.ndarray:
+        """
+        Interest clusters as a contiguous (k, dim) float32 matrix of unit rows.
+        The user profile is stored pre-normalized; load_profile() keeps it in
+        memory (no file mapping held across cycles) until the file changes.
+        Without a profile, the mission goal's embedding is the only cluster.
+        """
+        try:
+            profile = load_profile(PROFILE_PATH)
+        except Exception as e:
+            logger.warning(f"Failed to load user profile: {e}")
+            profile = None
+
+        if profile is None or len(profile) == 0:
+            # Use mission goal as vector (vectorize() is cached and returns unit vectors)
+            msg = f"{mission.goal} {' '.join(mission.languages)}"
+            return self.local_brain.vectorize(msg).reshape(1, -1)
+
+        return profile
+
+    async def _accept_finding(self, f_id: int, finding, summary: str, score: float):
+        """Store the analysis of an accepted finding and count it."""
+        await self._accept_findings([(f_id, finding, summary, score)])
+
+    async def _accept_findings(self, accepted: List[tuple]):
+        """Store (f_id, finding, summary, score) analyses in one write and count them."""
+        if not accepted:
+            return
+        await self.storage.update_findings_analysis_bulk(
+            [(f_id, summary, score) for f_id, _, summary, score in accepted]
+        )
+        self._count_accepted(accepted)
+
+    def _count_accepted(self, accepted: List[tuple]):
+        """Count (f_id, finding, summary, score) findings whose analysis is already stored."""
+        if not accepted:
+            return
+        self.session_stats["interested"] += len(accepted)
+        self.stats_changed.set()
+        if len(accepted) == 1:
+            _, finding, _, score = accepted[0]
+            logger.info(f"✅ Inbox +1: {finding.title} (Score: {score:.2f})")
+            return
+        # One summary line per screening batch; per-finding lines only when debugging
+        scores = [score for _, _, _, score in accepted]
+        logger.info(f"✅ Inbox +{len(accepted)} (avg score {sum(scores) / len(scores):.2f}, best {max(scores):.2f})")
+        if logger.isEnabledFor(logging.DEBUG):
+            for _, finding, _, score in accepted:
+                logger.debug(f"✅ Inbox: {finding.title} (Score: {score:.2f})")
 
     async def reflect_and_optimize(self, mission):
         """
@@ -321,16 +548,37 @@ class AutonomousManager:
                     )
                     
                     if new_strat:
-                        logger.info(f"✨ Applying AI-generated strategy: {json.dumps(new_strat)}")
-                        with open(self.strategy_path, "w") as f:
-                            json.dump(new_strat, f, indent=4)
+                        if self._write_strategy(new_strat):
+                            logger.info(f"✨ Applying AI-generated strategy: {fastjson.dumps(new_strat)}")
+                        else:
+                            logger.info("✨ AI-generated strategy unchanged; keeping strategy file")
                         
                         # Reset stats
                         self.session_stats["scanned"] = 0
                         self.session_stats["interested"] = 0
+                        self.session_stats["prefiltered"] = 0
+                        self.stats_changed.set()
                 except Exception as e:
                     logger.error(f"AI optimization failed: {e}")
 
+    def _write_strategy(self, strategy: Dict[str, Any]) -> bool:
+        """
+        Atomically replace the strategy file (temp file + os.replace), unless it
+        already holds an equal strategy. Returns whether the file was written.
+        """
+        try:
+            with open(self.strategy_path, "rb") as f:
+                if fastjson.loads(f.read()) == strategy:
+                    return False
+        except (OSError, ValueError):
+            pass
+
+        tmp_path = self.strategy_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(fastjson.dumps(strategy, indent=True))
+        os.replace(tmp_path, self.strategy_path)
+        return True
+
     def _should_use_ai_optimization(self, mission_name: str, recent_perf: List[Dict]) -> bool:
         """AI kullanılmalı mı?"""
         # Her 50 döngüde bir
@@ -348,7 +596,4 @@ class AutonomousManager:
 
     def stop(self):
         self.running = False
-
-def import_os_exists(path):
-    import os
-    return os.path.exists(path)
+        self.stats_changed.set()
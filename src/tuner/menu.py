@@ -3,16 +3,43 @@ import os
 import asyncio
 import subprocess
 import json
+import copy
+import sqlite3
+from datetime import datetime, timedelta, timezone
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.layout import Layout
 from rich.prompt import Prompt, Confirm
-from rich.align import Align
 from rich import box
 import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from tuner.storage import TunerStorage
+from tuner import fastjson
+
+# rich.layout pulls in rich.pretty (and attrs when installed): imported on first draw
+if TYPE_CHECKING:
+    from rich.layout import Layout
+
+# Dashboard stats are reused for this long between redraws
+STATS_TTL = 1.0
+# An agent process younger than this is shown as STARTING rather than RUNNING
+AGENT_STARTUP_GRACE = 1.5
+# How often the idle dashboard checks for agent/stats changes to redraw
+DASHBOARD_POLL_INTERVAL = 0.5
+
+def _tail_lines(path: str, n: int, block_size: int = 8192) -> list:
+    """Last n lines of a text file, read backwards in blocks from the end (not the whole file)."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        # n lines need n + 1 newlines when the file ends with one
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return buf.decode("utf-8", errors="ignore").splitlines()[-n:]
 
 class InteractiveMenu:
     def __init__(self):
@@ -20,13 +47,72 @@ class InteractiveMenu:
         self.db_path = "data/tuner.db"
         self.missions_path = "missions.json"
         self.agent_process = None
+        self._agent_started_at = 0.0
         self.running = True
+        # Read-only connection shared by the dashboard queries (opened on first use)
+        self._ro_conn = None
+        self._stats_cache = (0.0, None)
+        # Parsed missions.json keyed by (st_mtime_ns, st_size)
+        self._missions_cache = (None, [])
+        self._missions_table_cache = (None, None)
+        # One-shot status line shown under the next dashboard (instead of sleeping on the message)
+        self._notice = None
+        # Dashboard layout, built on first draw; _rendered holds the data each region shows
+        self._layout = None
+        self._rendered = {}
+
+    def _read_command(self, timeout: float):
+        """
+        Next command key, or None if none was pressed within timeout.
+        Keys are read one at a time without Enter on a terminal; with stdin
+        redirected this falls back to a blocking line read.
+        """
+        if sys.platform == "win32":
+            import msvcrt
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if msvcrt.kbhit():
+                    key = msvcrt.getwch()
+                    if key in ("\x00", "\xe0"):
+                        # Arrow/function keys send a prefix and a second code unit: consume both,
+                        # so only the (unknown) prefix comes back as one command
+                        msvcrt.getwch()
+                    return key.lower()
+                time.sleep(0.05)
+            return None
+
+        if not sys.stdin.isatty():
+            return self.console.input().strip().lower()
+
+        import select
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                return None
+            # Unbuffered reads on the fd select watched: a key like an arrow sends several
+            # bytes, whose tail must not come back as further commands
+            key = os.read(fd, 1)
+            while select.select([fd], [], [], 0)[0]:
+                if not os.read(fd, 64):
+                    break
+            return key.decode(errors="ignore").lower()
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
 
     def main_loop(self):
-        """Main TUI Loop."""
+        """Main TUI Loop: redraws on commands and whenever the agent status or stats change."""
+        self.print_dashboard()
         while self.running:
-            self.print_dashboard()
-            choice = self.console.input("\n[bold blue]Command > [/bold blue]").strip().lower()
+            choice = self._read_command(DASHBOARD_POLL_INTERVAL)
+            if choice is None:
+                if self._dashboard_state() != self._rendered.get("state"):
+                    self.print_dashboard()
+                continue
             
             if choice == 's':
                 self.toggle_agent()
@@ -46,116 +132,207 @@ class InteractiveMenu:
                 self.running = False
                 if self.agent_process:
                     self.agent_process.terminate()
+                self.close()
+                break
             else:
                 pass # Refresh
+            self.print_dashboard()
+
+    def _build_layout(self) -> "Layout":
+        """Dashboard skeleton with the static footer; header and body are filled per redraw."""
+        from rich.layout import Layout
+        from rich.align import Align
 
-    def print_dashboard(self):
-        self.console.clear()
-        
-        # 1. Status Section
-        status_color = "green" if self.agent_process and self.agent_process.poll() is None else "red"
-        status_text = "RUNNING" if status_color == "green" else "STOPPED"
-        
-        # Stats
-        stats = self.get_quick_stats()
-        missions = self.load_missions()
-        
         layout = Layout()
         layout.split(
             Layout(name="header", size=3),
             Layout(name="body", ratio=1),
             Layout(name="footer", size=6)
         )
-        
-        header_grid = Table.grid(expand=True)
-        header_grid.add_column(justify="left")
-        header_grid.add_column(justify="right")
-        header_grid.add_row(
-            "[bold white]GitHub Tuner[/bold white] [dim]Autonomous Agent[/dim]",
-            f"Agent: [{status_color}]{status_text}[/{status_color}]"
-        )
-        layout["header"].update(Panel(header_grid, style="white on blue"))
-        
-        body_grid = Table(box=box.SIMPLE, expand=True)
-        body_grid.add_column("Metric", style="cyan")
-        body_grid.add_column("Value", style="bold white")
-        
-        body_grid.add_row("📥 Inbox (Pending)", str(stats.get("pending", 0)))
-        body_grid.add_row("📊 Total Findings", str(stats.get("total", 0)))
-        body_grid.add_row("✅ AI Approved", str(stats.get("approved", 0)))
-        body_grid.add_row("🎯 Active Missions", str(len(missions)))
-        
-        layout["body"].update(Panel(body_grid, title="📈 Dashboard"))
-        
         footer_text = (
             "[bold][s][/bold] Start/Stop Agent  [bold][r][/bold] Review Inbox  [bold][p][/bold] Performance Report\n"
             "[bold][m][/bold] Manage Missions   [bold][o][/bold] Optimize  [bold][a][/bold] AI Usage  [bold][l][/bold] Logs  [bold][q][/bold] Quit"
         )
         layout["footer"].update(Panel(Align.center(footer_text), box=box.ROUNDED))
+        return layout
+
+    def _dashboard_state(self):
+        """((status_color, status_text), (pending, total, approved, mission count)) shown by the dashboard."""
+        # 1. Status Section
+        if self.agent_process and self.agent_process.poll() is None:
+            if time.monotonic() - self._agent_started_at < AGENT_STARTUP_GRACE:
+                status = ("yellow", "STARTING")
+            else:
+                status = ("green", "RUNNING")
+        else:
+            status = ("red", "STOPPED")
         
+        # Stats (TTL / mtime cached)
+        stats = self.get_quick_stats()
+        return status, (stats.get("pending", 0), stats.get("total", 0), stats.get("approved", 0), self.mission_count())
+
+    def print_dashboard(self):
+        self.console.clear()
+
+        state = self._dashboard_state()
+        (status_color, status_text), body_key = state
+
+        if self._layout is None:
+            self._layout = self._build_layout()
+        layout = self._layout
+
+        # Only regions whose data changed get new renderables
+        header_key = status_text
+        if header_key != self._rendered.get("header"):
+            header_grid = Table.grid(expand=True)
+            header_grid.add_column(justify="left")
+            header_grid.add_column(justify="right")
+            header_grid.add_row(
+                "[bold white]GitHub Tuner[/bold white] [dim]Autonomous Agent[/dim]",
+                f"Agent: [{status_color}]{status_text}[/{status_color}]"
+            )
+            layout["header"].update(Panel(header_grid, style="white on blue"))
+            self._rendered["header"] = header_key
+
+        if body_key != self._rendered.get("body"):
+            body_grid = Table(box=box.SIMPLE, expand=True)
+            body_grid.add_column("Metric", style="cyan")
+            body_grid.add_column("Value", style="bold white")
+            
+            body_grid.add_row("📥 Inbox (Pending)", str(body_key[0]))
+            body_grid.add_row("📊 Total Findings", str(body_key[1]))
+            body_grid.add_row("✅ AI Approved", str(body_key[2]))
+            body_grid.add_row("🎯 Active Missions", str(body_key[3]))
+            
+            layout["body"].update(Panel(body_grid, title="📈 Dashboard"))
+            self._rendered["body"] = body_key
+        
+        self._rendered["state"] = state
         self.console.print(layout)
+        if self._notice:
+            self.console.print(self._notice)
+            self._notice = None
+        self.console.print("\n[bold blue]Command > [/bold blue]", end="")
+        # No newline after the prompt: flush so it shows before the key wait
+        self.console.file.flush()
+
+    def _ro_connection(self):
+        """Shared read-only connection; never takes write locks the agent would wait on."""
+        if self._ro_conn is None:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            self._ro_conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            # Temp b-trees (GROUP BY/ORDER BY) in memory; reads through a shared mmap of the file
+            self._ro_conn.execute("PRAGMA query_only = 1")
+            self._ro_conn.execute("PRAGMA temp_store = MEMORY")
+            self._ro_conn.execute("PRAGMA mmap_size = 268435456")
+        return self._ro_conn
+
+    def close(self):
+        if self._ro_conn is not None:
+            self._ro_conn.close()
+            self._ro_conn = None
 
     def get_quick_stats(self):
-        import sqlite3
+        ts, cached = self._stats_cache
+        if cached is not None and time.monotonic() - ts < STATS_TTL:
+            return cached
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM findings WHERE status='pending'")
-            pending = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM findings")
-            total = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM findings WHERE match_score > 0.25")
-            approved = cursor.fetchone()[0]
-            conn.close()
-            return {"pending": pending, "total": total, "approved": approved}
+            # All three counts in one scan; SUM() is NULL on an empty table
+            total, pending, approved = self._ro_connection().execute("""
+                SELECT COUNT(*),
+                       SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN match_score > 0.25 THEN 1 ELSE 0 END)
+                FROM findings
+            """).fetchone()
+            stats = {"pending": pending or 0, "total": total, "approved": approved or 0}
         except:
+            # No database yet (read-only open fails): retry with a fresh connection next time
+            self.close()
             return {"pending": "?", "total": "?", "approved": "?"}
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
 
-    def load_missions(self):
+    def _cached_missions(self) -> list:
+        """Parsed missions.json, re-parsed only when the file changed. Shared: do not mutate."""
         try:
-            with open(self.missions_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            st = os.stat(self.missions_path)
+            key = (st.st_mtime_ns, st.st_size)
+            if key != self._missions_cache[0]:
+                with open(self.missions_path, "rb") as f:
+                    self._missions_cache = (key, fastjson.loads(f.read()))
         except:
-            return []
+            self._missions_cache = (None, [])
+        return self._missions_cache[1]
+
+    def load_missions(self):
+        """Missions from missions.json (callers get a copy to edit)."""
+        return copy.deepcopy(self._cached_missions())
+
+    def mission_count(self) -> int:
+        """Number of missions, without copying them (dashboard polling)."""
+        return len(self._cached_missions())
 
     def save_missions(self, missions):
-        with open(self.missions_path, "w", encoding="utf-8") as f:
+        """Write missions.json via a temp file + os.replace, so the running agent never reads half a file."""
+        tmp_path = self.missions_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(missions, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, self.missions_path)
+        # Same-size rewrites within the mtime granularity would look unchanged
+        self._missions_cache = (None, [])
+
+    def _invalidate_stats(self):
+        self._stats_cache = (0.0, None)
+
+    def _spawn_cli(self, *args) -> subprocess.Popen:
+        """
+        Start `python -m tuner.cli <args>` without blocking the menu: in its own
+        console window on Windows, detached in the background (output discarded,
+        it logs to tuner.log) elsewhere.
+        """
+        cmd = [sys.executable, "-m", "tuner.cli", *args]
+        if sys.platform == "win32":
+            return subprocess.Popen(cmd, creationflags=subprocess.CREATE_NEW_CONSOLE)
+        return subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
 
     def toggle_agent(self):
         if self.agent_process and self.agent_process.poll() is None:
             self.agent_process.terminate()
-            self.console.print("[yellow]⏹ Stopping agent...[/yellow]")
-            time.sleep(1)
+            self._notice = "[yellow]⏹ Stopping agent...[/yellow]"
         else:
-            cmd = [sys.executable, "-m", "tuner.cli", "agent"]
-            self.agent_process = subprocess.Popen(cmd, creationflags=subprocess.CREATE_NEW_CONSOLE)
-            self.console.print("[green]▶ Agent started in new window![/green]")
-            time.sleep(1)
+            self.agent_process = self._spawn_cli("agent")
+            self._agent_started_at = time.monotonic()
+            where = "in new window" if sys.platform == "win32" else "in background (see logs)"
+            self._notice = f"[green]▶ Agent started {where}![/green]"
 
     def run_review(self):
         from tuner.review_tui import ReviewTUI
         asyncio.run(ReviewTUI(self.db_path).run())
+        # Reviewing changes statuses: show fresh counts right away
+        self._invalidate_stats()
 
     def show_report(self):
         """Display performance report inline."""
         self.console.clear()
         self.console.print(Panel("[bold]📊 Performance Report[/bold]", style="blue"))
         
-        import sqlite3
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._ro_connection().cursor()
             
-            # Basic stats
-            cursor.execute("SELECT COUNT(*) FROM findings")
-            total = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM findings WHERE match_score > 0.25")
-            approved = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM feedback_logs WHERE action='like'")
-            likes = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM feedback_logs WHERE action='dislike'")
-            dislikes = cursor.fetchone()[0]
+            # Basic stats: one statement, one aggregate pass per table
+            cursor.execute("""
+                SELECT f.total, f.approved, l.likes, l.dislikes
+                FROM (SELECT COUNT(*) AS total,
+                             COALESCE(SUM(match_score > 0.25), 0) AS approved
+                      FROM findings) AS f,
+                     (SELECT COALESCE(SUM(action = 'like'), 0) AS likes,
+                             COALESCE(SUM(action = 'dislike'), 0) AS dislikes
+                      FROM feedback_logs) AS l
+            """)
+            total, approved, likes, dislikes = cursor.fetchone()
             
             # Rejection reasons
             cursor.execute("""
@@ -166,8 +343,6 @@ class InteractiveMenu:
             """)
             rejection_cats = cursor.fetchall()
             
-            conn.close()
-            
             yield_rate = (approved / total * 100) if total > 0 else 0
             user_rate = (likes / (likes + dislikes) * 100) if (likes + dislikes) > 0 else 0
             
@@ -194,38 +369,59 @@ class InteractiveMenu:
         
         self.console.input("\n[dim]Press Enter to return...[/dim]")
 
+    def _missions_table(self, missions) -> Table:
+        """Mission list table, reused while missions.json is unchanged since the last load."""
+        key = self._missions_cache[0]
+        if key is not None and key == self._missions_table_cache[0]:
+            return self._missions_table_cache[1]
+
+        table = Table(title=f"{len(missions)} Active Missions", box=box.ROUNDED)
+        table.add_column("#", style="dim")
+        table.add_column("Name", style="cyan")
+        table.add_column("Seed Repos", style="white")
+        table.add_column("Languages", style="green")
+        table.add_column("Constraints", style="yellow")
+        
+        for i, m in enumerate(missions, 1):
+            # One lookup per field
+            seeds = m.get("seed_repos")
+            goal = m.get("goal")
+            min_stars = m.get("min_stars")
+            max_days = m.get("max_days_since_commit")
+
+            langs = ", ".join(m.get("languages") or ())[:15]
+            # Show seed repos instead of raw query
+            if seeds:
+                seed_preview = ", ".join(r.rpartition("/")[2] for r in seeds)[:25]
+            elif goal:
+                seed_preview = f"Query: {goal[:20]}"
+            else:
+                seed_preview = "No seeds"
+
+            if min_stars and max_days:
+                constraint_str = f"⭐>{min_stars}, 📅<{max_days}d"
+            elif min_stars:
+                constraint_str = f"⭐>{min_stars}"
+            elif max_days:
+                constraint_str = f"📅<{max_days}d"
+            else:
+                constraint_str = "None"
+            
+            table.add_row(str(i), m["name"], seed_preview, langs, constraint_str)
+
+        self._missions_table_cache = (key, table)
+        return table
+
     def manage_missions(self):
         """Mission management sub-menu."""
+        missions = self.load_missions()
         while True:
             self.console.clear()
-            missions = self.load_missions()
             
             self.console.print(Panel("[bold]🎯 Mission Manager[/bold]", style="blue"))
             
             # Display current missions
-            table = Table(title=f"{len(missions)} Active Missions", box=box.ROUNDED)
-            table.add_column("#", style="dim")
-            table.add_column("Name", style="cyan")
-            table.add_column("Seed Repos", style="white")
-            table.add_column("Languages", style="green")
-            table.add_column("Constraints", style="yellow")
-            
-            for i, m in enumerate(missions, 1):
-                langs = ", ".join(m.get("languages", []))[:15]
-                # Show seed repos instead of raw query
-                seed_preview = "No seeds"
-                if m.get("seed_repos"):
-                    seed_preview = ", ".join([r.split("/")[-1] for r in m["seed_repos"]])[:25]
-                elif m.get("goal"):
-                    seed_preview = f"Query: {m['goal'][:20]}"
-
-                constraints = []
-                if m.get("min_stars"): constraints.append(f"⭐>{m['min_stars']}")
-                if m.get("max_days_since_commit"): constraints.append(f"📅<{m['max_days_since_commit']}d")
-                constraint_str = ", ".join(constraints) if constraints else "None"
-                
-                table.add_row(str(i), m["name"], seed_preview, langs, constraint_str)
-            
+            table = self._missions_table(missions)
             self.console.print(table)
             
             self.console.print("\n[bold][1][/bold] Add Mission  [bold][2][/bold] Edit Mission  [bold][3][/bold] Delete Mission  [bold][b][/bold] Back")
@@ -239,6 +435,10 @@ class InteractiveMenu:
                 self.delete_mission(missions)
             elif choice == 'b':
                 break
+            else:
+                continue
+            # Re-read after a change (or an aborted edit that left the list half-modified)
+            missions = self.load_missions()
 
     def add_mission(self, missions):
         self.console.print("\n[bold green]➕ Add New Mission[/bold green]")
@@ -349,45 +549,30 @@ class InteractiveMenu:
         self.console.clear()
         self.console.print(Panel("[bold]🤖 AI Usage Statistics[/bold]", style="blue"))
         
-        import sqlite3
-        from datetime import datetime, timedelta
-        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Total calls
-            cursor.execute("SELECT COUNT(*) FROM ai_usage")
-            total_calls = cursor.fetchone()[0]
-            
-            # Successful vs failed
-            cursor.execute("SELECT COUNT(*) FROM ai_usage WHERE success = 1")
-            successful = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM ai_usage WHERE success = 0")
-            failed = cursor.fetchone()[0]
+            cursor = self._ro_connection().cursor()
             
-            # Total tokens (estimated)
-            cursor.execute("SELECT SUM(tokens_in), SUM(tokens_out) FROM ai_usage WHERE success = 1")
-            row = cursor.fetchone()
-            tokens_in = row[0] or 0
-            tokens_out = row[1] or 0
-            
-            # By call type
+            # One scan grouped by call type; the overview is the sum over the groups.
+            # Per group: calls, tokens, avg duration, then success/failure counts, tokens of
+            # successful calls, rate limit errors and calls in the last 24 hours.
+            # timestamp is CURRENT_TIMESTAMP (UTC, "YYYY-MM-DD HH:MM:SS"): compare in that format
+            yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
             cursor.execute("""
-                SELECT call_type, COUNT(*), SUM(tokens_in), SUM(tokens_out), AVG(duration_ms)
+                SELECT call_type, COUNT(*), SUM(tokens_in), SUM(tokens_out), AVG(duration_ms),
+                       COALESCE(SUM(success = 1), 0),
+                       COALESCE(SUM(success = 0), 0),
+                       COALESCE(SUM(CASE WHEN success = 1 THEN tokens_in END), 0),
+                       COALESCE(SUM(CASE WHEN success = 1 THEN tokens_out END), 0),
+                       COALESCE(SUM(error_type = 'rate_limit'), 0),
+                       COALESCE(SUM(timestamp > ?), 0)
                 FROM ai_usage
                 GROUP BY call_type
-            """)
-            by_type = cursor.fetchall()
-            
-            # Rate limit errors
-            cursor.execute("SELECT COUNT(*) FROM ai_usage WHERE error_type = 'rate_limit'")
-            rate_limits = cursor.fetchone()[0]
-            
-            # Last 24 hours
-            yesterday = (datetime.now() - timedelta(days=1)).isoformat()
-            cursor.execute(f"SELECT COUNT(*) FROM ai_usage WHERE timestamp > '{yesterday}'")
-            last_24h = cursor.fetchone()[0]
+            """, (yesterday,))
+            groups = cursor.fetchall()
+            by_type = [row[:5] for row in groups]
+            total_calls = sum(row[1] for row in groups)
+            totals = [sum(column) for column in zip(*(row[5:] for row in groups))] or [0] * 6
+            successful, failed, tokens_in, tokens_out, rate_limits, last_24h = totals
             
             # Recent errors
             cursor.execute("""
@@ -399,8 +584,6 @@ class InteractiveMenu:
             """)
             recent_errors = cursor.fetchall()
             
-            conn.close()
-            
             # Display stats
             table = Table(title="📊 Overview", box=box.ROUNDED)
             table.add_column("Metric", style="cyan")
@@ -449,37 +632,38 @@ class InteractiveMenu:
         self.console.input("\n[dim]Press Enter to return...[/dim]")
 
     def run_optimization(self):
-        """Run AI strategy optimization in new terminal window."""
-        self.console.print("[cyan]🧠 Starting AI Strategy Optimization in new window...[/cyan]")
-        cmd = [sys.executable, "-m", "tuner.cli", "optimize"]
-        subprocess.Popen(cmd, creationflags=subprocess.CREATE_NEW_CONSOLE)
-        self.console.print("[green]✅ Optimization started! Check the new terminal window.[/green]")
-        time.sleep(2)
+        """Run AI strategy optimization in a separate process."""
+        self._spawn_cli("optimize")
+        if sys.platform == "win32":
+            self._notice = "[green]✅ Optimization started! Check the new terminal window.[/green]"
+        else:
+            self._notice = "[green]✅ Optimization started in background; strategy.json is updated when it finishes.[/green]"
 
     def view_logs(self):
         self.console.clear()
         self.console.print(Panel("[bold]📋 Recent Logs[/bold]", style="blue"))
         try:
-            with open("tuner.log", "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()[-20:]
-                for line in lines:
-                    # Clean up and display
-                    clean = line.strip()
-                    if "[INFO]" in clean:
-                        self.console.print(f"[green]{clean}[/green]")
-                    elif "[WARNING]" in clean:
-                        self.console.print(f"[yellow]{clean}[/yellow]")
-                    elif "[ERROR]" in clean:
-                        self.console.print(f"[red]{clean}[/red]")
-                    else:
-                        self.console.print(f"[dim]{clean}[/dim]")
+            for line in _tail_lines("tuner.log", 20):
+                # Clean up and display
+                clean = line.strip()
+                if "[INFO]" in clean:
+                    self.console.print(f"[green]{clean}[/green]")
+                elif "[WARNING]" in clean:
+                    self.console.print(f"[yellow]{clean}[/yellow]")
+                elif "[ERROR]" in clean:
+                    self.console.print(f"[red]{clean}[/red]")
+                else:
+                    self.console.print(f"[dim]{clean}[/dim]")
         except FileNotFoundError:
             self.console.print("[red]No log file found.[/red]")
         self.console.input("\n[dim]Press Enter to return...[/dim]")
 
 def main():
     menu = InteractiveMenu()
-    menu.main_loop()
+    try:
+        menu.main_loop()
+    finally:
+        menu.close()
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,8 @@ import os
 from dataclasses import dataclass, asdict, field
 from typing import List, Optional, Dict, Any, Union
 
+from tuner import fastjson
+
 @dataclass
 class Mission:
     name: str  # e.g., "Python AI Research"
@@ -44,8 +46,8 @@ class MissionControl:
         # 1. Try missions.json (List)
         if os.path.exists(self.mission_path):
             try:
-                with open(self.mission_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.mission_path, "rb") as f:
+                    data = fastjson.loads(f.read())
                     if isinstance(data, list):
                         self.missions = [Mission.from_dict(m) for m in data]
                     else:
@@ -57,8 +59,8 @@ class MissionControl:
         # 2. Try legacy mission.json (Single) if list is empty
         if not self.missions and os.path.exists(self.legacy_path):
             try:
-                with open(self.legacy_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.legacy_path, "rb") as f:
+                    data = fastjson.loads(f.read())
                     self.missions = [Mission.from_dict(data)]
             except Exception:
                 pass
@@ -95,8 +97,11 @@ class MissionControl:
         """Save current missions to file."""
         if self.missions:
             data = [m.to_dict() for m in self.missions]
-            with open(self.mission_path, "w", encoding="utf-8") as f:
+            # Atomic swap: the menu and the agent both read this file while the other writes
+            tmp_path = self.mission_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=4)
+            os.replace(tmp_path, self.mission_path)
 
     def update_mission(self, name: str, goal: str, languages: List[str]):
         """Update the active mission (legacy support - updates current)."""
@@ -0,0 +1,101 @@
+"""
+User interest profile persistence.
+
+The profile is a (k, dim) matrix of interest cluster centers stored as a
+contiguous float32 .npy file with every row already L2-normalized, so
+similarity against the profile is a plain matmul with no per-read
+conversion. Reads are memoized in memory on the file's mtime, so repeated
+loads in one process cost a stat() call. No mapping of the file outlives a
+call: on Windows a mapped file cannot be replaced by another process (init,
+reset, a full save). Full saves are atomic so a crash mid-write never leaves
+a truncated profile behind; single-cluster updates (votes) only rewrite the
+changed rows in place.
+"""
+import os
+import numpy as np
+from typing import Dict, Iterable, Optional, Tuple
+
+from tuner.brain import l2_normalize
+
+# Loaded .npy files keyed by path -> (st_mtime_ns, read-only in-memory array)
+_profile_cache: Dict[str, Tuple[int, np.ndarray]] = {}
+
+
+def _to_profile(clusters: np.ndarray) -> np.ndarray:
+    """Stored form of a cluster matrix: 2-D, contiguous, float32, unit rows."""
+    clusters = np.asarray(clusters)
+    if clusters.ndim == 1:
+        clusters = clusters.reshape(1, -1)
+    return np.ascontiguousarray(l2_normalize(clusters))
+
+
+def _is_stored_form(clusters: np.ndarray) -> bool:
+    if clusters.dtype != np.float32 or clusters.ndim != 2:
+        return False
+    norms = np.linalg.norm(clusters, axis=1)
+    return bool(np.all((np.abs(norms - 1.0) < 1e-3) | (norms == 0.0)))
+
+
+def _load_npy(path: str) -> Optional[np.ndarray]:
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _profile_cache.pop(path, None)
+        return None
+
+    cached = _profile_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    clusters = np.load(path)
+    if not _is_stored_form(clusters):
+        # Profile written by an older version (float64 / raw centers): convert once
+        _save_npy(path, _to_profile(clusters))
+        return _load_npy(path)
+    # Shared by every caller: copy before modifying
+    clusters.setflags(write=False)
+    _profile_cache[path] = (mtime_ns, clusters)
+    return clusters
+
+
+def _save_npy(path: str, array: np.ndarray):
+    _profile_cache.pop(path, None)
+    tmp_path = path + ".tmp"
+    # Save through a file handle: np.save(str) would append another ".npy"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+
+def load_profile(path: str) -> Optional[np.ndarray]:
+    """
+    Return the (k, dim) float32 matrix of unit-length clusters for path, or None if missing.
+    The array is cached and read-only (copy it before modifying).
+    """
+    return _load_npy(path)
+
+
+def save_profile(path: str, clusters: np.ndarray):
+    """Normalize and write the cluster matrix via a temp file + os.replace."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    _save_npy(path, _to_profile(clusters))
+
+
+def write_profile_rows(path: str, clusters: np.ndarray, rows: Iterable[int]):
+    """
+    Normalize clusters[rows] and write them into the stored profile in place
+    through a memmap, so a vote touches O(d) bytes instead of rewriting the
+    whole file. The map is opened per call on purpose: a handle kept between
+    votes would stop other processes from replacing the file on Windows, and
+    the open/stat it saves is small next to the vote's embedding.
+    """
+    rows = sorted(set(rows))
+    mm = np.lib.format.open_memmap(path, mode="r+")
+    try:
+        mm[rows] = l2_normalize(clusters[rows])
+        # msync only writes back the dirty pages, i.e. the touched rows
+        mm.flush()
+    finally:
+        del mm
+    # The mtime check would catch this too, unless the clock granularity hides it
+    _profile_cache.pop(path, None)
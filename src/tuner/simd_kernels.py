@@ -0,0 +1,51 @@
+"""
+Similarity kernels for screening.
+
+Screening only needs the best cluster match per finding, so the numba kernel
+computes max(dot) row by row without materializing the (n, k) similarity
+matrix, in parallel across findings. numba is optional (pip install numba);
+without it, or for small batches where compile/dispatch overhead dominates,
+a numpy matmul is used.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# n * k * dim below which the BLAS matmul is at least as fast
+NUMBA_MIN_WORK = 2_000_000
+
+if NUMBA_AVAILABLE:
+    # fastmath minus ninf/nnan: best starts at -inf, which "no infinities" would break
+    @njit(parallel=True, fastmath={"nsz", "arcp", "contract", "reassoc", "afn"}, cache=True)
+    def _max_dot_numba(vectors, clusters):
+        n, dim = vectors.shape
+        k = clusters.shape[0]
+        out = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            best = -np.inf
+            for j in range(k):
+                acc = 0.0
+                for t in range(dim):
+                    acc += vectors[i, t] * clusters[j, t]
+                if acc > best:
+                    best = acc
+            out[i] = best
+        return out
+
+
+def max_similarity(vectors: np.ndarray, clusters: np.ndarray) -> np.ndarray:
+    """
+    Best dot product of each row of vectors (n, dim) against clusters (k, dim), k >= 1.
+    For unit-length rows on both sides this is the max cosine similarity.
+    """
+    n, dim = vectors.shape
+    if NUMBA_AVAILABLE and n * len(clusters) * dim >= NUMBA_MIN_WORK:
+        return _max_dot_numba(
+            np.ascontiguousarray(vectors, dtype=np.float32),
+            np.ascontiguousarray(clusters, dtype=np.float32)
+        )
+    return (vectors @ clusters.T).max(axis=1)
@@ -1,36 +1,114 @@
 import aiosqlite
+import asyncio
+import contextvars
 import json
 import sqlite3
 import os
+import re
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Set, Union
+
+# Terms counted in the feedback aggregate (lowercase words of 3+ chars)
+_TERM_RE = re.compile(r"[a-z][a-z0-9+#]{2,}")
+_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "that", "this", "from", "your", "you", "are",
+    "based", "using", "into", "its", "not", "all", "can", "use", "via", "more",
+})
+# Sentinel term holding the total number of votes per action
+_TOTAL_TERM = "*"
+
+# On-disk format of findings.embedding for new rows; findings.embedding_dtype records
+# it per row (rows from before the column existed are float32)
+EMBEDDING_DTYPE = "float16"
+
+def encode_embedding(vector) -> bytes:
+    """Serialize an embedding vector in EMBEDDING_DTYPE."""
+    import numpy as np  # lazy: keeps numpy out of CLI commands that only list/count
+    return np.ascontiguousarray(vector, dtype=EMBEDDING_DTYPE).tobytes()
+
+def decode_embedding(blob: bytes, dtype: Optional[str] = None):
+    """Stored embedding bytes back to a float32 vector (dtype from findings.embedding_dtype)."""
+    import numpy as np
+    return np.frombuffer(blob, dtype=dtype or "float32").astype(np.float32)
+
+# Findings whose url is in a JSON array parameter (see save_findings_bulk)
+_URLS_IN_JSON_SQL = "SELECT {columns} FROM findings WHERE url IN (SELECT value FROM json_each(?))"
+
+def _feedback_terms(title: str, description: str, language: str = None) -> List[str]:
+    """Distinct terms of a finding used for feedback aggregation."""
+    text = f"{(title or '').replace('/', ' ')} {description or ''}".lower()
+    terms = {t for t in _TERM_RE.findall(text) if t not in _STOPWORDS}
+    if language:
+        terms.add(f"lang:{language.lower()}")
+    return sorted(terms)
+
+# Applied to every connection (unlike journal_mode=WAL, these are not stored in the file):
+# commits wait for the WAL write, not an fsync (durable at checkpoint); temp b-trees and a
+# 64 MiB page cache in memory; reads through mmap; wait on the agent's write lock, don't fail
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+"""
 
 class TunerStorage:
-    def __init__(self, db_path: str = "data/tuner.db"):
+    def __init__(self, db_path: str = "data/tuner.db", keep_connection: bool = False):
         self.db_path = db_path
         # For :memory:, we need to keep the connection alive if we want data to persist between calls
         # within the same process. aiosqlite.connect returns a context manager, but we can also await it
         # to get a connection object.
-        self._memory_conn = None
+        # keep_connection=True does the same for file databases, so short-lived callers (CLI commands)
+        # reuse one connection instead of opening one per operation. close() must be called.
+        self.keep_connection = keep_connection or db_path == ":memory:"
+        self._conn = None
+        # Serializes use of the persistent connection: statements of concurrent callers would
+        # otherwise interleave inside each other's transactions (created on first use)
+        self._conn_lock: Optional[asyncio.Lock] = None
+        # Task running a transaction() on the persistent connection; other tasks' calls
+        # wait for the lock instead of joining (or skipping the commit of) that transaction
+        self._transaction_task = contextvars.ContextVar(f"tuner_transaction_{id(self)}", default=None)
 
     async def initialize(self):
         """Initialize the database schema."""
         if self.db_path != ":memory:":
              os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-             async with aiosqlite.connect(self.db_path) as db:
-                 # Enable WAL mode for concurrency
+             if self.keep_connection:
+                 if not self._conn:
+                     self._conn = await self._open_connection()
+                 # Enable WAL mode for concurrency (persistent: stored in the database file)
+                 await self._conn.execute("PRAGMA journal_mode = WAL;")
+                 await self._create_tables(self._conn)
+                 return
+             async with self._connection() as db:
                  await db.execute("PRAGMA journal_mode = WAL;")
-                 await db.execute("PRAGMA synchronous = NORMAL;")
                  await self._create_tables(db)
         else:
             # For memory, we create a persistent connection
-            self._memory_conn = await aiosqlite.connect(self.db_path)
-            await self._create_tables(self._memory_conn)
+            self._conn = await self._open_connection()
+            await self._create_tables(self._conn)
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """New connection with the per-connection PRAGMAs applied."""
+        conn = await aiosqlite.connect(self.db_path)
+        await conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+
+    @asynccontextmanager
+    async def _connection(self):
+        """Short-lived tuned connection, closed on exit."""
+        conn = await self._open_connection()
+        try:
+            yield conn
+        finally:
+            await conn.close()
 
     async def close(self):
-        if self._memory_conn:
-            await self._memory_conn.close()
-            self._memory_conn = None
+        if self._conn:
+            await self._conn.close()
+            self._conn = None
 
     async def reset_database(self):
         """Reset the database by dropping all tables."""
@@ -59,7 +137,8 @@ class TunerStorage:
                 description TEXT,
                 stars INTEGER,
                 language TEXT,
-                embedding BLOB,
+                embedding BLOB, -- raw vector in embedding_dtype: see decode_embedding()
+                embedding_dtype TEXT DEFAULT 'float32',
                 ai_summary TEXT,
                 match_score REAL,
                 status TEXT DEFAULT 'pending',
@@ -67,6 +146,9 @@ class TunerStorage:
             )
         """)
 
+        # Pending inbox is read best-first: index range scan instead of full scan + sort
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_findings_status_score ON findings (status, match_score DESC)")
+
         # Strategies table
         await db.execute("""
             CREATE TABLE IF NOT EXISTS strategies (
@@ -89,6 +171,37 @@ class TunerStorage:
             )
         """)
         
+        # Incremental feedback aggregate: vote counts per (term, action)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS feedback_agg (
+                term TEXT NOT NULL,
+                action TEXT NOT NULL,
+                count INTEGER DEFAULT 0,
+                PRIMARY KEY (term, action)
+            )
+        """)
+
+        # README bodies with their ETag, keyed by "owner/repo/branch", for conditional re-fetches
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS readme_cache (
+                repo TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                etag TEXT NOT NULL,
+                body TEXT,
+                fetched_at INTEGER
+            )
+        """)
+
+        # CloudBrain.analyze_repo results keyed by model + README hash
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS ai_analysis_cache (
+                key TEXT PRIMARY KEY,
+                summary TEXT,
+                score REAL,
+                created_at INTEGER
+            )
+        """)
+
         # Check if columns exist (migration hack for dev)
         try:
              await db.execute("ALTER TABLE feedback_logs ADD COLUMN category TEXT")
@@ -96,6 +209,11 @@ class TunerStorage:
         try:
              await db.execute("ALTER TABLE feedback_logs ADD COLUMN reason TEXT")
         except: pass
+        try:
+             await db.execute("ALTER TABLE findings ADD COLUMN embedding_dtype TEXT DEFAULT 'float32'")
+        except: pass
+        # Report: dislikes grouped by category (after the migration above adds category)
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_feedback_action_category ON feedback_logs (action, category)")
 
         # Tasks Queue table
         await db.execute("""
@@ -126,6 +244,8 @@ class TunerStorage:
                 timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        # AI usage panel: latest failed calls
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_ai_usage_success_ts ON ai_usage (success, timestamp DESC)")
         
         # Tactic Performance tracking (ExperienceMemory)
         await db.execute("""
@@ -193,37 +313,147 @@ class TunerStorage:
             )
         """)
         
+        await self._backfill_feedback_agg(db)
+
         await db.commit()
 
-    def _get_conn_ctx(self):
-        if self.db_path == ":memory:":
-            if self._memory_conn:
-                # To simulate context manager behavior for persistent connection
-                class MockContext:
-                    def __init__(self, conn): self.conn = conn
-                    async def __aenter__(self): return self.conn
-                    async def __aexit__(self, exc_type, exc, tb): pass
-                return MockContext(self._memory_conn)
+    async def _backfill_feedback_agg(self, db):
+        """Build feedback_agg from feedback_logs once for databases that predate it."""
+        async with db.execute("SELECT 1 FROM feedback_agg LIMIT 1") as cursor:
+            if await cursor.fetchone():
+                return
+        async with db.execute("""
+            SELECT fl.action, f.title, f.description, f.language
+            FROM feedback_logs fl
+            JOIN findings f ON fl.finding_id = f.id
+        """) as cursor:
+            rows = await cursor.fetchall()
+        for action, title, description, language in rows:
+            await self._bump_feedback_agg(db, action, _feedback_terms(title, description, language))
+
+    async def _bump_feedback_agg(self, db, action: str, terms: List[str]):
+        await db.executemany("""
+            INSERT INTO feedback_agg (term, action, count) VALUES (?, ?, 1)
+            ON CONFLICT(term, action) DO UPDATE SET count = count + 1
+        """, [(term, action) for term in [_TOTAL_TERM] + terms])
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Run several storage calls as one write transaction, committed once on exit
+        and rolled back on error. Needs a persistent connection (keep_connection or
+        :memory:); without one each call still commits on its own. Only the task
+        that opened it joins it: other tasks' calls wait until it ends.
+        """
+        if self._conn is None or self._in_transaction:
+            yield
+            return
+
+        async with self._shared_lock():
+            await self._conn.execute("BEGIN IMMEDIATE")
+            token = self._transaction_task.set(asyncio.current_task())
+            try:
+                yield
+            except BaseException:
+                await self._conn.rollback()
+                raise
             else:
-                 # Should have been initialized
-                 return aiosqlite.connect(self.db_path)
-        else:
-            return aiosqlite.connect(self.db_path)
+                await self._conn.commit()
+            finally:
+                self._transaction_task.reset(token)
+
+    @property
+    def _in_transaction(self) -> bool:
+        """Whether the current task is inside its own transaction()."""
+        return self._transaction_task.get() is asyncio.current_task()
+
+    async def _commit(self, db):
+        """Commit unless an enclosing transaction() will."""
+        if not self._in_transaction:
+            await db.commit()
+
+    def _shared_lock(self) -> asyncio.Lock:
+        if self._conn_lock is None:
+            self._conn_lock = asyncio.Lock()
+        return self._conn_lock
+
+    @asynccontextmanager
+    async def _shared_connection(self):
+        """The persistent connection, held exclusively for one operation (statements through commit)."""
+        if self._in_transaction:
+            # transaction() already holds the lock
+            yield self._conn
+            return
+        async with self._shared_lock():
+            yield self._conn
+
+    def _get_conn_ctx(self):
+        if self._conn:
+            return self._shared_connection()
+        # Not initialized yet (or per-operation mode)
+        return self._connection()
 
     async def save_finding(self, title: str, url: str, description: str, stars: int, language: str, embedding: bytes = None) -> int:
-        """Save a new finding or ignore if exists."""
+        """Save a new finding or ignore if exists. embedding comes from encode_embedding()."""
         async with self._get_conn_ctx() as db:
             try:
                 cursor = await db.execute("""
-                    INSERT INTO findings (title, url, description, stars, language, embedding, status)
-                    VALUES (?, ?, ?, ?, ?, ?, 'pending')
-                """, (title, url, description, stars, language, embedding))
-                await db.commit()
+                    INSERT INTO findings (title, url, description, stars, language, embedding, embedding_dtype, status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 'pending')
+                """, (title, url, description, stars, language, embedding, EMBEDDING_DTYPE))
+                await self._commit(db)
                 return cursor.lastrowid
             except sqlite3.IntegrityError:
                 # URL already exists
                 return -1
 
+    async def save_findings_bulk(self, rows: List[tuple]) -> List[int]:
+        """
+        Save many findings in one transaction.
+        rows are (title, url, description, stars, language, embedding) tuples
+        (embedding from encode_embedding()),
+        optionally followed by (ai_summary, match_score) when the verdict is
+        already known; returns the new id per row, or -1 where the URL already
+        exists (including repeats within rows).
+        """
+        if not rows:
+            return []
+        rows = [tuple(row) + (None,) * (8 - len(row)) for row in rows]
+        urls = [row[1] for row in rows]
+        # The URL list is one JSON parameter, so the SQL text is the same for every
+        # batch size and sqlite3's statement cache reuses the compiled lookups
+        urls_json = json.dumps(urls)
+        async with self._get_conn_ctx() as db:
+            if not self._in_transaction:
+                # Hold the write lock from the existence check to the insert
+                await db.execute("BEGIN IMMEDIATE")
+            try:
+                async with db.execute(_URLS_IN_JSON_SQL.format(columns="url"), (urls_json,)) as cursor:
+                    taken = {r[0] for r in await cursor.fetchall()}
+                new_rows = []
+                for row in rows:
+                    if row[1] not in taken:
+                        taken.add(row[1])
+                        new_rows.append(row)
+                await db.executemany("""
+                    INSERT INTO findings (title, url, description, stars, language, embedding, ai_summary, match_score,
+                                          embedding_dtype, status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'pending')
+                """, [row + (EMBEDDING_DTYPE,) for row in new_rows])
+                async with db.execute(_URLS_IN_JSON_SQL.format(columns="url, id"), (urls_json,)) as cursor:
+                    ids = dict(await cursor.fetchall())
+                await self._commit(db)
+            except BaseException:
+                if not self._in_transaction:
+                    await db.rollback()
+                raise
+        new_ids = {row[1]: ids[row[1]] for row in new_rows}
+        result = []
+        for url in urls:
+            # Only the first occurrence of a URL gets its id
+            result.append(new_ids.pop(url, -1))
+        return result
+
     async def update_finding_analysis(self, finding_id: int, summary: str, score: float):
         """Update a finding with AI analysis."""
         async with self._get_conn_ctx() as db:
@@ -232,13 +462,25 @@ class TunerStorage:
                 SET ai_summary = ?, match_score = ?
                 WHERE id = ?
             """, (summary, score, finding_id))
-            await db.commit()
+            await self._commit(db)
+
+    async def update_findings_analysis_bulk(self, updates: List[tuple]):
+        """Apply many (finding_id, summary, score) analyses with one commit."""
+        if not updates:
+            return
+        async with self._get_conn_ctx() as db:
+            await db.executemany("""
+                UPDATE findings
+                SET ai_summary = ?, match_score = ?
+                WHERE id = ?
+            """, [(summary, score, finding_id) for finding_id, summary, score in updates])
+            await self._commit(db)
 
     async def update_finding_status(self, finding_id: int, status: str):
         """Update status (pending, liked, disliked, archived)."""
         async with self._get_conn_ctx() as db:
             await db.execute("UPDATE findings SET status = ? WHERE id = ?", (status, finding_id))
-            await db.commit()
+            await self._commit(db)
 
     async def log_feedback(self, finding_id: int, action: str, category: str = None, reason: str = None):
         """Log user feedback with optional category and reason."""
@@ -247,7 +489,12 @@ class TunerStorage:
                 INSERT INTO feedback_logs (finding_id, action, category, reason)
                 VALUES (?, ?, ?, ?)
             """, (finding_id, action, category, reason))
-            await db.commit()
+
+            async with db.execute("SELECT title, description, language FROM findings WHERE id = ?", (finding_id,)) as cursor:
+                row = await cursor.fetchone()
+            terms = _feedback_terms(*row) if row else []
+            await self._bump_feedback_agg(db, action, terms)
+            await self._commit(db)
 
     async def get_finding(self, finding_id: int) -> Optional[Dict[str, Any]]:
         """Get a single finding by ID."""
@@ -257,6 +504,58 @@ class TunerStorage:
                 row = await cursor.fetchone()
                 return dict(row) if row else None
 
+    async def get_cached_readme(self, repo: str) -> Optional[tuple]:
+        """(url, etag, body) of the last README fetched for repo ("owner/repo/branch"), or None."""
+        async with self._get_conn_ctx() as db:
+            async with db.execute("SELECT url, etag, body FROM readme_cache WHERE repo = ?", (repo,)) as cursor:
+                row = await cursor.fetchone()
+                return tuple(row) if row else None
+
+    async def get_cached_readmes(self, repos: List[str]) -> Dict[str, tuple]:
+        """get_cached_readme for many repos in one query: {repo: (url, etag, body)} for the cached ones."""
+        if not repos:
+            return {}
+        async with self._get_conn_ctx() as db:
+            async with db.execute("""
+                SELECT repo, url, etag, body FROM readme_cache
+                WHERE repo IN (SELECT value FROM json_each(?))
+            """, (json.dumps(repos),)) as cursor:
+                return {row[0]: tuple(row[1:]) for row in await cursor.fetchall()}
+
+    async def cache_readme(self, repo: str, url: str, etag: str, body: str):
+        """Remember a fetched README and its ETag."""
+        await self.cache_readmes([(repo, url, etag, body)])
+
+    async def cache_readmes(self, rows: List[tuple]):
+        """Remember many fetched READMEs in one statement; rows are (repo, url, etag, body)."""
+        if not rows:
+            return
+        async with self._get_conn_ctx() as db:
+            await db.executemany("""
+                INSERT OR REPLACE INTO readme_cache (repo, url, etag, body, fetched_at)
+                VALUES (?, ?, ?, ?, strftime('%s', 'now'))
+            """, rows)
+            await self._commit(db)
+
+    async def get_cached_analysis(self, key: str, max_age: int) -> Optional[tuple]:
+        """(summary, score) cached for key if younger than max_age seconds, else None."""
+        async with self._get_conn_ctx() as db:
+            async with db.execute("""
+                SELECT summary, score FROM ai_analysis_cache
+                WHERE key = ? AND created_at >= strftime('%s', 'now') - ?
+            """, (key, max_age)) as cursor:
+                row = await cursor.fetchone()
+                return tuple(row) if row else None
+
+    async def cache_analysis(self, key: str, summary: str, score: float):
+        """Remember an AI analysis result."""
+        async with self._get_conn_ctx() as db:
+            await db.execute("""
+                INSERT OR REPLACE INTO ai_analysis_cache (key, summary, score, created_at)
+                VALUES (?, ?, ?, strftime('%s', 'now'))
+            """, (key, summary, score))
+            await self._commit(db)
+
     async def save_strategy(self, config: Dict[str, Any]):
         """Save a search strategy."""
         async with self._get_conn_ctx() as db:
@@ -264,7 +563,7 @@ class TunerStorage:
                 INSERT INTO strategies (search_config)
                 VALUES (?)
             """, (json.dumps(config),))
-            await db.commit()
+            await self._commit(db)
 
     async def get_latest_strategy(self) -> Optional[Dict[str, Any]]:
         """Get the most recent strategy."""
@@ -275,14 +574,56 @@ class TunerStorage:
                     return json.loads(row[0])
                 return None
 
-    async def get_pending_findings(self) -> List[Dict[str, Any]]:
-        """Get all pending findings."""
+    async def get_pending_findings(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get pending findings, best match first (all of them unless limit is given)."""
+        query = "SELECT * FROM findings WHERE status = 'pending' ORDER BY match_score DESC"
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
         async with self._get_conn_ctx() as db:
             db.row_factory = aiosqlite.Row
-            async with db.execute("SELECT * FROM findings WHERE status = 'pending' ORDER BY match_score DESC") as cursor:
+            async with db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
 
+    async def get_pending_overview(self, limit: int, summary_chars: int = 100) -> List[tuple]:
+        """
+        Compact rows for listing: (id, match_score, url, title, summary), best match first.
+        The summary is truncated in SQL so long AI summaries never leave the database.
+        """
+        async with self._get_conn_ctx() as db:
+            async with db.execute("""
+                SELECT id, match_score, url, title,
+                       CASE WHEN length(ai_summary) > ? THEN substr(ai_summary, 1, ?) || '...'
+                            ELSE ifnull(ai_summary, '') END
+                FROM findings
+                WHERE status = 'pending'
+                ORDER BY match_score DESC
+                LIMIT ?
+            """, (summary_chars, summary_chars, limit)) as cursor:
+                return [tuple(row) for row in await cursor.fetchall()]
+
+    async def any_findings(self) -> bool:
+        """True if the findings table has at least one row (stops at the first one)."""
+        async with self._get_conn_ctx() as db:
+            async with db.execute("SELECT EXISTS(SELECT 1 FROM findings)") as cursor:
+                row = await cursor.fetchone()
+                return bool(row[0])
+
+    async def count_findings(self, status: str = "pending") -> int:
+        """Number of findings with the given status."""
+        async with self._get_conn_ctx() as db:
+            async with db.execute("SELECT COUNT(*) FROM findings WHERE status = ?", (status,)) as cursor:
+                row = await cursor.fetchone()
+                return row[0]
+
+    async def get_known_urls(self) -> Set[str]:
+        """URLs of every stored finding (served from the url UNIQUE index)."""
+        async with self._get_conn_ctx() as db:
+            async with db.execute("SELECT url FROM findings") as cursor:
+                return {row[0] for row in await cursor.fetchall()}
+
     async def get_feedback_history(self) -> List[Dict[str, Any]]:
         """Get feedback history for analysis."""
         async with self._get_conn_ctx() as db:
@@ -296,6 +637,27 @@ class TunerStorage:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
 
+    async def get_feedback_aggregate(self, top_n: int = 30) -> Dict[str, Any]:
+        """
+        Summarized feedback: vote totals per action and the most frequent
+        terms among liked/disliked findings (maintained by log_feedback).
+        """
+        async with self._get_conn_ctx() as db:
+            async with db.execute("SELECT action, count FROM feedback_agg WHERE term = ?", (_TOTAL_TERM,)) as cursor:
+                totals = {row[0]: row[1] for row in await cursor.fetchall()}
+
+            top_terms = {}
+            for action in totals:
+                async with db.execute("""
+                    SELECT term, count FROM feedback_agg
+                    WHERE action = ? AND term != ?
+                    ORDER BY count DESC, term ASC
+                    LIMIT ?
+                """, (action, _TOTAL_TERM, top_n)) as cursor:
+                    top_terms[action] = {row[0]: row[1] for row in await cursor.fetchall()}
+
+            return {"totals": totals, "top_terms": top_terms}
+
     # ============== ExperienceMemory Methods ==============
     
     async def log_tactic_performance(
@@ -318,7 +680,7 @@ class TunerStorage:
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (mission_name, tactic_name, query_used, results_found, 
                   results_accepted, results_rejected, success_rate))
-            await db.commit()
+            await self._commit(db)
     
     async def get_recent_tactic_performance(
         self, 
@@ -378,7 +740,7 @@ class TunerStorage:
                 (rule_type, rule_value, mission_name, confidence, source)
                 VALUES (?, ?, ?, ?, ?)
             """, (rule_type, rule_value, mission_name, confidence, source))
-            await db.commit()
+            await self._commit(db)
     
     async def get_learned_rules(
         self, 
@@ -432,6 +794,11 @@ class TaskQueue:
         Get the next pending task atomically.
         If worker_type is specified (e.g. 'search'), only pop tasks of that type.
         """
+        tasks = await self.pop_tasks(worker_type, limit=1)
+        return tasks[0] if tasks else None
+
+    async def pop_tasks(self, worker_type: str = None, limit: int = 1) -> List[Dict[str, Any]]:
+        """Claim up to limit pending tasks (highest priority, oldest first) in one transaction."""
         async with self.storage._get_conn_ctx() as db:
             db.row_factory = aiosqlite.Row
 
@@ -449,23 +816,21 @@ class TaskQueue:
                     elif worker_type == 'processor':
                         query += " AND type = 'analyze'"
 
-                query += " ORDER BY priority DESC, created_at ASC LIMIT 1"
+                query += " ORDER BY priority DESC, created_at ASC LIMIT ?"
 
-                async with db.execute(query) as cursor:
-                    task = await cursor.fetchone()
+                async with db.execute(query, (limit,)) as cursor:
+                    tasks = [dict(row) for row in await cursor.fetchall()]
 
-                if task:
-                    task_dict = dict(task)
+                if tasks:
                     # Mark as processing
-                    await db.execute("UPDATE tasks SET status = 'processing' WHERE id = ?", (task_dict['id'],))
-                    await db.commit()
-
-                    # Parse payload
-                    task_dict['payload'] = json.loads(task_dict['payload'])
-                    return task_dict
-
+                    await db.executemany("UPDATE tasks SET status = 'processing' WHERE id = ?",
+                                         [(task['id'],) for task in tasks])
                 await db.commit()
-                return None
+
+                # Parse payload
+                for task in tasks:
+                    task['payload'] = json.loads(task['payload'])
+                return tasks
             except Exception:
                 await db.rollback()
                 raise
@@ -476,6 +841,14 @@ class TaskQueue:
             await db.execute("UPDATE tasks SET status = 'completed' WHERE id = ?", (task_id,))
             await db.commit()
 
+    async def complete_tasks(self, task_ids: List[str]):
+        """Mark several tasks as completed in one commit."""
+        if not task_ids:
+            return
+        async with self.storage._get_conn_ctx() as db:
+            await db.executemany("UPDATE tasks SET status = 'completed' WHERE id = ?", [(i,) for i in task_ids])
+            await db.commit()
+
     async def fail_task(self, task_id: str, error: str):
         """Mark task as failed or retry."""
         async with self.storage._get_conn_ctx() as db:
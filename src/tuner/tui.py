@@ -2,7 +2,9 @@
 TUI for GitHub Tuner
 """
 import logging
-from typing import List, Dict, Any
+import threading
+from collections import deque
+from typing import Dict, Any, Deque, Tuple
 import datetime
 from rich.console import Console, Group
 from rich.layout import Layout
@@ -28,8 +30,12 @@ class TunerDashboard:
     def __init__(self, console: Console):
         self.console = console
         self.layout = Layout()
-        self.logs: List[Text] = []
-        self.findings: List[Dict[str, Any]] = []
+        self.logs: Deque[Text] = deque(maxlen=50)
+        # Raw (timestamp, message, level) records, turned into Text once per render
+        self._pending_logs: Deque[Tuple[datetime.datetime, str, int]] = deque(maxlen=50)
+        # Flushed from both the Live refresh thread and add_log (for errors)
+        self._flush_lock = threading.Lock()
+        self.findings: Deque[Dict[str, Any]] = deque(maxlen=20)
         self.status_message = "Initializing..."
         self.iteration_info = "Waiting to start..."
         self.stats = {"scanned": 0, "analyzed": 0, "errors": 0}
@@ -59,13 +65,26 @@ class TunerDashboard:
         self.stats["errors"] = errors
 
     def add_finding(self, finding: Dict[str, Any]):
-        """Add a finding to the list."""
-        self.findings.insert(0, finding)
-        # Keep only top 20
-        self.findings = self.findings[:20]
+        """Add a finding to the list (only the 20 most recent are kept)."""
+        self.findings.appendleft(finding)
 
     def add_log(self, message: str, level: int):
-        """Add a log message."""
+        """
+        Queue a log message. Records are buffered and rendered in one batch
+        per Live refresh; errors are flushed immediately.
+        """
+        self._pending_logs.append((datetime.datetime.now(), message, level))
+        if level >= logging.ERROR:
+            self._flush_logs()
+
+    def _flush_logs(self):
+        """Convert buffered log records into styled Text lines."""
+        with self._flush_lock:
+            while self._pending_logs:
+                timestamp, message, level = self._pending_logs.popleft()
+                self.logs.append(self._format_log(timestamp, message, level))
+
+    def _format_log(self, timestamp: datetime.datetime, message: str, level: int) -> Text:
         color = "white"
         if level >= logging.ERROR:
             color = "red"
@@ -76,11 +95,7 @@ class TunerDashboard:
         elif level == logging.DEBUG:
             color = "dim"
 
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        text = Text(f"[{timestamp}] {message}", style=color)
-        self.logs.append(text)
-        # Keep only last 50 logs
-        self.logs = self.logs[-50:]
+        return Text(f"[{timestamp.strftime('%H:%M:%S')}] {message}", style=color)
 
     def _generate_header(self) -> Panel:
         """Create the header panel."""
@@ -128,6 +143,7 @@ class TunerDashboard:
 
     def __rich__(self) -> Layout:
         """Render the layout."""
+        self._flush_logs()
         self.layout["header"].update(self._generate_header())
         self.layout["findings"].update(self._generate_findings_table())
         self.layout["logs"].update(self._generate_log_panel())
@@ -4,13 +4,16 @@ import json
 import traceback
 from typing import Dict, Any
 
-from tuner.storage import TaskQueue, TunerStorage
+from tuner.storage import TaskQueue, TunerStorage, encode_embedding
 from tuner.monitor import RateLimitMonitor
 from tuner.hunter import Hunter
 from tuner.brain import LocalBrain, CloudBrain
 
 logger = logging.getLogger(__name__)
 
+# Analyze tasks the processor embeds and saves per round trip
+PROCESSOR_BATCH_SIZE = 32
+
 class WorkerManager:
     def __init__(self, db_path: str = "data/tuner.db"):
         self.queue = TaskQueue(db_path)
@@ -25,7 +28,7 @@ class WorkerManager:
         # We need to refactor Hunter to accept monitor, or monkey-patch it,
         # or just let the worker handle the sleep and update monitor manually.
         # For now, we'll instantiate Hunter per use or shared.
-        self.hunter = Hunter()
+        self.hunter = Hunter(storage=self.storage)
         # Ideally, Hunter should use a shared httpx client session, but it creates one in __init__.
 
         self.running = False
@@ -149,51 +152,37 @@ class WorkerManager:
 
     async def processor_worker(self):
         """
-        The Processor: Consumes 'analyze' tasks.
+        The Processor: Consumes 'analyze' tasks, up to PROCESSOR_BATCH_SIZE at a time.
         Payload: { "meta": {...}, "readme": "..." }
         """
         while self.running:
+            tasks = []
             try:
-                task = await self.queue.pop_task("processor")
-                if not task:
+                tasks = await self.queue.pop_tasks("processor", limit=PROCESSOR_BATCH_SIZE)
+                if not tasks:
                     await asyncio.sleep(0.5)
                     continue
 
-                payload = task['payload']
-                meta = payload['meta']
-                readme = payload['readme']
+                metas = [task['payload']['meta'] for task in tasks]
 
-                # 1. Local Vectorization
-                text = f"{meta['full_name']} {meta['description'] or ''}"
+                # 1. Local Vectorization: one model call for the whole batch
                 # Ideally we want to vectorize the README too, but it might be too long.
                 # Let's just use title+desc for now as per original logic, or add summary later.
-                embedding = self.local_brain.vectorize(text)
-
-                # Save initial finding
-                f_id = await self.storage.save_finding(
-                    title=meta['full_name'],
-                    url=meta['html_url'],
-                    description=meta['description'] or "",
-                    stars=meta['stargazers_count'],
-                    language=meta['language'] or "Unknown",
-                    embedding=embedding.tobytes()
-                )
-
-                if f_id != -1:
-                    # 2. Check if we should use Cloud Brain
-                    # For now, let's just save it.
-                    # The original logic filtered here.
-                    # Let's assume the processor just ingests for now,
-                    # OR we can do the screening here.
-
-                    # NOTE: To keep it simple for this phase, we just save.
-                    # Screening/Filtering can be a separate step or done here if we load user profile.
-                    pass
+                texts = [f"{meta['full_name']} {meta['description'] or ''}" for meta in metas]
+                embeddings = self.local_brain.vectorize_batch(texts)
 
-                await self.queue.complete_task(task['id'])
+                # Save initial findings: one transaction, duplicates are skipped
+                # NOTE: Screening/Filtering can be a separate step or done here if we load user profile.
+                await self.storage.save_findings_bulk([
+                    (meta['full_name'], meta['html_url'], meta['description'] or "",
+                     meta['stargazers_count'], meta['language'] or "Unknown", encode_embedding(embedding))
+                    for meta, embedding in zip(metas, embeddings)
+                ])
+
+                await self.queue.complete_tasks([task['id'] for task in tasks])
 
             except Exception as e:
                 logger.error(f"Processor failed: {e}")
-                if task:
+                for task in tasks:
                     await self.queue.fail_task(task['id'], str(e))
                 await asyncio.sleep(1)
@@ -2,9 +2,10 @@ import asyncio
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 import numpy as np
-from tuner.hunter import Hunter
+from tuner.hunter import Hunter, RawFinding
 from tuner.brain import LocalBrain
 from tuner.storage import TunerStorage
+from tuner.profile import load_profile, save_profile, write_profile_rows
 
 # Mocks for external dependencies
 
@@ -49,6 +50,128 @@ async def test_hunter_fetch_user_stars(mock_httpx_client):
         assert descriptions[0] == "owner/repo1 desc1"
         assert descriptions[1] == "owner/repo2 desc2"
 
+@pytest.mark.asyncio
+async def test_hunter_fetch_user_stars_pages(mock_httpx_client):
+    hunter = Hunter()
+    with patch.dict("os.environ", {"GITHUB_TOKEN": "fake_token"}):
+        def make_page(page):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {"link": '<https://api.github.com/user/starred?per_page=100&page=3>; rel="last"'}
+            resp.json.return_value = [{"full_name": f"owner/p{page}-{i}", "description": ""} for i in range(100)]
+            return resp
+
+        async def fake_get(url, headers=None, params=None):
+            return make_page(params["page"])
+
+        hunter.client.get = AsyncMock(side_effect=fake_get)
+
+        descriptions = await hunter.fetch_user_starred_repos(limit=250)
+
+        # Only the 3 pages needed for 250 items are requested, results keep page order
+        assert hunter.client.get.call_count == 3
+        assert len(descriptions) == 250
+        assert descriptions[0] == "owner/p1-0"
+        assert descriptions[-1] == "owner/p3-49"
+
+@pytest.mark.asyncio
+async def test_hunter_fetch_readme_prefers_first_filename(mock_httpx_client):
+    hunter = Hunter()
+
+    async def fake_get(url):
+        resp = MagicMock()
+        if url.endswith("/README.md"):
+            # Slowest probe, but preferred when it exists
+            await asyncio.sleep(0.01)
+            resp.status_code, resp.text = 200, "markdown"
+        elif url.endswith("/README.rst"):
+            resp.status_code, resp.text = 200, "rst"
+        else:
+            resp.status_code = 404
+        return resp
+
+    hunter.client.get = AsyncMock(side_effect=fake_get)
+
+    # All filenames are probed at once
+    assert await hunter._fetch_readme("owner", "repo", "main") == "markdown"
+    assert hunter.client.get.call_count == 4
+
+@pytest.mark.asyncio
+async def test_hunter_fetch_readme_revalidates_cached_etag(mock_httpx_client):
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+    hunter = Hunter(storage=storage)
+
+    async def fake_get(url, headers=None):
+        resp = MagicMock()
+        if headers and headers.get("If-None-Match") == '"v1"':
+            resp.status_code = 304
+        elif url.endswith("/README.md"):
+            resp.status_code, resp.text, resp.headers = 200, "body", {"etag": '"v1"'}
+        else:
+            resp.status_code = 404
+        return resp
+
+    hunter.client.get = AsyncMock(side_effect=fake_get)
+
+    try:
+        assert await hunter._fetch_readme("owner", "repo", "main") == "body"
+        hunter.client.get.reset_mock()
+
+        # Second fetch: one conditional request, body served from the cache
+        assert await hunter._fetch_readme("owner", "repo", "main") == "body"
+        hunter.client.get.assert_called_once()
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_hunter_page_batches_readme_cache(mock_httpx_client):
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+    hunter = Hunter(storage=storage)
+
+    async def fake_get(url, headers=None):
+        resp = MagicMock()
+        if headers and headers.get("If-None-Match"):
+            resp.status_code = 304
+        elif url.endswith("/README.md"):
+            resp.status_code, resp.text, resp.headers = 200, url, {"etag": '"v1"'}
+        else:
+            resp.status_code = 404
+        return resp
+
+    hunter.client.get = AsyncMock(side_effect=fake_get)
+    items = [{"owner": {"login": "owner"}, "name": f"repo{i}", "default_branch": "main",
+              "full_name": f"owner/repo{i}", "html_url": f"https://github.com/owner/repo{i}",
+              "description": None, "stargazers_count": i, "language": None} for i in range(5)]
+
+    try:
+        with patch.object(storage, "get_cached_readme", wraps=storage.get_cached_readme) as single_read, \
+             patch.object(storage, "cache_readmes", wraps=storage.cache_readmes) as write:
+            first = await hunter._process_page(items)
+            second = [f async for f in hunter.iter_findings(items)]
+
+        # One cache write for the first page; the second page is all 304s
+        assert [f.readme_content for f in first] == [f.readme_content for f in sorted(second, key=lambda f: f.stars)]
+        write.assert_called_once()
+        assert len(write.call_args.args[0]) == 5
+        single_read.assert_not_called()
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_hunter_retries_rate_limited_request(mock_httpx_client):
+    hunter = Hunter()
+    limited = MagicMock(status_code=429, headers={"retry-after": "0"})
+    forbidden = MagicMock(status_code=403, headers={})
+    ok = MagicMock(status_code=200, headers={})
+    hunter.client.get = AsyncMock(side_effect=[limited, ok, forbidden])
+
+    # 429 is retried after Retry-After; a plain 403 is returned as-is
+    assert await hunter._request("GET", "https://api.github.com/x") is ok
+    assert await hunter._request("GET", "https://api.github.com/x") is forbidden
+    assert hunter.client.get.call_count == 3
+
 @pytest.mark.asyncio
 async def test_hunter_star_repo(mock_httpx_client):
     hunter = Hunter()
@@ -101,6 +224,92 @@ def test_local_brain_clustering_fallback():
     # Should return all points if less than k
     assert len(clusters) == 1
 
+def test_local_brain_vectorize_is_normalized():
+    brain = LocalBrain()
+    vec = brain.vectorize("some repo description")
+
+    assert vec.dtype == np.float32
+    assert np.isclose(np.linalg.norm(vec), 1.0, atol=1e-5)
+    # Unit vectors: the dot-product shortcut matches full cosine
+    other = brain.vectorize("another description")
+    assert np.isclose(
+        brain.calculate_similarity(vec, other, pre_normalized=True),
+        brain.calculate_similarity(vec, other),
+        atol=1e-5
+    )
+
+def test_local_brain_vectorize_batch():
+    brain = LocalBrain()
+    brain.model = MagicMock()
+    brain.model.encode.return_value = np.ones((3, 4), dtype=np.float32) * 0.5
+
+    vectors = brain.vectorize_batch(["a", "", "c"])
+
+    # One model call for the whole batch; empty text still maps to a zero vector
+    brain.model.encode.assert_called_once()
+    assert vectors.shape == (3, 4)
+    assert not vectors[1].any()
+    assert np.allclose(vectors[0], 0.5)
+
+def test_local_brain_vectorize_cached():
+    brain = LocalBrain()
+    brain.model = MagicMock()
+    brain.model.encode.return_value = np.ones(4, dtype=np.float32)
+
+    first = brain.vectorize("same text")
+    second = brain.vectorize("same text")
+
+    # Repeated text hits the cache; shared result is read-only
+    brain.model.encode.assert_called_once()
+    assert first is second
+    assert not first.flags.writeable
+
+def test_max_similarity_matches_matmul():
+    from tuner.simd_kernels import max_similarity
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((7, 16)).astype(np.float32)
+    clusters = rng.standard_normal((3, 16)).astype(np.float32)
+
+    assert np.allclose(max_similarity(vectors, clusters), (vectors @ clusters.T).max(axis=1), atol=1e-5)
+
+# Test Profile
+
+def test_profile_row_update(tmp_path):
+    path = str(tmp_path / "user_profile.npy")
+    save_profile(path, np.eye(3, 4) * 2.0)
+
+    # Stored normalized as float32
+    clusters = np.array(load_profile(path))
+    assert clusters.dtype == np.float32
+    assert clusters[0].tolist() == [1.0, 0.0, 0.0, 0.0]
+
+    clusters[1] = 3.0
+    write_profile_rows(path, clusters, [1])
+
+    # Only the written row changes on disk (normalized), and the next load sees it
+    on_disk = np.load(path)
+    assert np.allclose(on_disk[1], [0.5] * 4)
+    assert on_disk[0].tolist() == [1.0, 0.0, 0.0, 0.0]
+    assert np.allclose(load_profile(path)[1], [0.5] * 4)
+
+    # The file can still be replaced by a full save, and loads follow it
+    save_profile(path, np.eye(2, 4))
+    assert load_profile(path).tolist() == [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]]
+
+def test_profile_migrates_legacy_file(tmp_path):
+    path = str(tmp_path / "user_profile.npy")
+    np.save(path, np.eye(2, 3) * 4.0)  # Old format: float64, raw centers
+
+    clusters = load_profile(path)
+    assert clusters.dtype == np.float32
+    assert clusters.tolist() == [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+    # Converted in place on disk
+    on_disk = np.load(path)
+    assert on_disk.dtype == np.float32
+    assert on_disk.tolist() == clusters.tolist()
+
 # Test Storage (Async)
 
 @pytest.mark.asyncio
@@ -113,6 +322,7 @@ async def test_storage_get_finding():
     await storage.initialize()
 
     try:
+        assert not await storage.any_findings()
         f_id = await storage.save_finding("Test Title", "http://test.url", "Test Desc", 100, "Python")
         assert f_id != -1
 
@@ -123,5 +333,331 @@ async def test_storage_get_finding():
 
         finding = await storage.get_finding(999)
         assert finding is None
+        assert await storage.any_findings()
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_storage_feedback_aggregate():
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+
+    try:
+        a = await storage.save_finding("owner/fast-parser", "http://a.url", "Rust parser", 10, "Rust")
+        b = await storage.save_finding("owner/slow-parser", "http://b.url", "Python parser", 10, "Python")
+        await storage.log_feedback(a, "like")
+        await storage.log_feedback(b, "dislike")
+
+        agg = await storage.get_feedback_aggregate()
+        assert agg["totals"] == {"like": 1, "dislike": 1}
+        assert agg["top_terms"]["like"]["parser"] == 1
+        assert agg["top_terms"]["like"]["lang:rust"] == 1
+        assert "lang:rust" not in agg["top_terms"]["dislike"]
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_storage_transaction_rolls_back():
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+
+    try:
+        f_id = await storage.save_finding("Test Title", "http://test.url", "Test Desc", 100, "Python")
+
+        with pytest.raises(RuntimeError):
+            async with storage.transaction():
+                await storage.update_finding_status(f_id, "liked")
+                await storage.log_feedback(f_id, "like")
+                raise RuntimeError("boom")
+
+        finding = await storage.get_finding(f_id)
+        assert finding["status"] == "pending"
+
+        async with storage.transaction():
+            await storage.update_finding_status(f_id, "liked")
+            await storage.log_feedback(f_id, "like")
+
+        finding = await storage.get_finding(f_id)
+        assert finding["status"] == "liked"
+        assert (await storage.get_feedback_aggregate())["totals"] == {"like": 1}
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_storage_transaction_is_owned_by_its_task():
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+    f_id = await storage.save_finding("Test Title", "http://test.url", "Test Desc", 100, "Python")
+    started = asyncio.Event()
+
+    async def failing_vote():
+        async with storage.transaction():
+            await storage.update_finding_status(f_id, "liked")
+            started.set()
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+    async def other_write():
+        await started.wait()
+        await storage.cache_analysis("k", "s", 0.5)
+
+    try:
+        results = await asyncio.gather(failing_vote(), other_write(), return_exceptions=True)
+        assert isinstance(results[0], RuntimeError)
+        # The other task's write waited for the rollback instead of joining it
+        assert await storage.get_cached_analysis("k", 60) == ("s", 0.5)
+        assert (await storage.get_finding(f_id))["status"] == "pending"
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_storage_shared_connection_concurrent_writes():
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+
+    rows = [(f"o/r{i}", f"http://r{i}", "desc", i, "Python", None) for i in range(20)]
+    try:
+        results = await asyncio.gather(
+            *[storage.cache_analysis(f"k{i}", "s", 0.5) for i in range(5)],
+            storage.save_findings_bulk(rows),
+            storage.cache_readmes([(f"o/r{i}/main", "u", "e", "b") for i in range(5)]),
+        )
+        assert -1 not in results[5]
+        assert len(await storage.get_known_urls()) == len(rows)
+        assert await storage.get_cached_analysis("k4", 60) == ("s", 0.5)
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_storage_save_findings_bulk():
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+
+    try:
+        old_id = await storage.save_finding("Old", "http://a", "", 1, "Python")
+        ids = await storage.save_findings_bulk([
+            ("A", "http://a", "", 1, "Python", None),
+            ("B", "http://b", "", 2, "Go", None),
+            ("B again", "http://b", "", 2, "Go", None),
+        ])
+
+        # Existing and repeated URLs come back as -1
+        assert ids[0] == -1 and ids[2] == -1
+        assert ids[1] not in (-1, old_id)
+
+        await storage.update_findings_analysis_bulk([(ids[1], "Filtered", 0.2), (old_id, "Auto-Accepted", 0.8)])
+        assert (await storage.get_finding(ids[1]))["match_score"] == 0.2
+        assert (await storage.get_finding(old_id))["ai_summary"] == "Auto-Accepted"
+        assert await storage.get_known_urls() == {"http://a", "http://b"}
+
+        # Rows may carry their verdict, written with the insert
+        (c_id,) = await storage.save_findings_bulk([("C", "http://c", "", 3, "Rust", None, "Filtered", 0.1)])
+        assert (await storage.get_finding(c_id))["ai_summary"] == "Filtered"
+    finally:
+        await storage.close()
+
+@pytest.mark.asyncio
+async def test_task_queue_pop_tasks_batch():
+    from tuner.storage import TaskQueue
+
+    queue = TaskQueue(":memory:")
+    await queue.storage.initialize()
+
+    try:
+        low = await queue.enqueue_task("analyze", {"n": 0}, priority=0)
+        high = await queue.enqueue_task("analyze", {"n": 1}, priority=10)
+        await queue.enqueue_task("search", {"n": 2})
+
+        tasks = await queue.pop_tasks("processor", limit=5)
+        assert [t["id"] for t in tasks] == [high, low]
+        assert tasks[0]["payload"] == {"n": 1}
+        # Claimed tasks are not handed out again
+        assert await queue.pop_tasks("processor", limit=5) == []
+
+        await queue.complete_tasks([t["id"] for t in tasks])
+        assert (await queue.pop_task("scout"))["payload"] == {"n": 2}
+    finally:
+        await queue.storage.close()
+
+def test_embedding_roundtrip():
+    from tuner.storage import EMBEDDING_DTYPE, decode_embedding, encode_embedding
+
+    vec = np.linspace(-1, 1, 384, dtype=np.float32)
+    blob = encode_embedding(vec)
+
+    # Half-precision storage, decoded back to float32 with negligible drift
+    assert len(blob) == 384 * np.dtype(EMBEDDING_DTYPE).itemsize
+    decoded = decode_embedding(blob, EMBEDDING_DTYPE)
+    assert decoded.dtype == np.float32
+    assert np.allclose(decoded, vec, atol=1e-3)
+
+@pytest.mark.asyncio
+async def test_storage_analysis_cache():
+    storage = TunerStorage(":memory:")
+    await storage.initialize()
+
+    try:
+        assert await storage.get_cached_analysis("model:abc", max_age=60) is None
+        await storage.cache_analysis("model:abc", "Nice tool", 0.7)
+        assert await storage.get_cached_analysis("model:abc", max_age=60) == ("Nice tool", 0.7)
+        # Older than max_age counts as a miss
+        assert await storage.get_cached_analysis("model:abc", max_age=-10) is None
     finally:
         await storage.close()
+
+# Test Manager
+
+@pytest.mark.asyncio
+async def test_adaptive_thresholds_memoizes_success_rate():
+    from tuner.manager import AdaptiveThresholds
+
+    storage = MagicMock()
+    storage.get_tactic_success_rates = AsyncMock(return_value={"a": 0.0, "b": 0.0})
+    thresholds = AdaptiveThresholds(storage)
+
+    first = await thresholds.get_threshold("m", "similarity_threshold")
+    assert await thresholds.get_threshold("m", "similarity_threshold") == first
+    storage.get_tactic_success_rates.assert_awaited_once()
+
+    thresholds.invalidate("m")
+    await thresholds.get_threshold("m", "similarity_threshold")
+    assert storage.get_tactic_success_rates.await_count == 2
+
+def test_matches_mission_filters_stars_and_language():
+    from tuner.manager import _matches_mission
+    from tuner.mission import Mission
+
+    mission = Mission(name="m", goal="g", languages=["Python", "Rust"], min_stars=10)
+    assert _matches_mission({"stargazers_count": 50, "language": "python"}, mission)
+    assert not _matches_mission({"stargazers_count": 5, "language": "Python"}, mission)
+    assert not _matches_mission({"stargazers_count": 50, "language": "Go"}, mission)
+    assert not _matches_mission({"stargazers_count": 50, "language": None}, mission)
+
+    mission.languages = ["Any"]
+    assert _matches_mission({"stargazers_count": 50, "language": None}, mission)
+
+# Test CLI helpers
+
+def test_cli_run_closes_shared_resources():
+    from tuner.cli import _run
+
+    async def command():
+        return 42
+
+    with patch("tuner.cli._close_shared", new_callable=AsyncMock) as close_shared:
+        assert _run(command()) == 42
+    close_shared.assert_awaited_once()
+
+def test_cli_parse_github_repo():
+    from tuner.cli import _parse_github_repo
+
+    assert _parse_github_repo("https://github.com/owner/repo") == ("owner", "repo")
+    assert _parse_github_repo("https://github.com/owner/my.lib.git/?tab=readme#top") == ("owner", "my.lib")
+    assert _parse_github_repo("https://github.com/owner/repo/tree/main") == ("owner", "repo")
+    assert _parse_github_repo("https://gitlab.com/owner/repo") is None
+    assert _parse_github_repo("https://github.com/owner") is None
+
+def test_max_similarity_numba_matches_matmul(monkeypatch):
+    from tuner import simd_kernels
+    if not simd_kernels.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(simd_kernels, "NUMBA_MIN_WORK", 0)
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((64, 32)).astype(np.float32)
+    clusters = rng.standard_normal((7, 32)).astype(np.float32)
+
+    np.testing.assert_allclose(simd_kernels.max_similarity(vectors, clusters),
+                               (vectors @ clusters.T).max(axis=1), rtol=1e-4, atol=1e-4)
+
+@pytest.mark.asyncio
+async def test_research_cycle_pipeline(tmp_path, monkeypatch):
+    from tuner.manager import AutonomousManager
+    monkeypatch.chdir(tmp_path)
+
+    # title -> similarity to the single interest cluster (e0)
+    sims = {"o/high": 0.9, "o/low": 0.1, **{f"o/maybe{i}": 0.4 for i in range(4)}}
+
+    def vectorize_batch(texts):
+        out = np.zeros((len(texts), 8), dtype=np.float32)
+        for row, text in zip(out, texts):
+            sim = sims[text.split()[0]]
+            row[0], row[1] = sim, np.sqrt(1 - sim * sim)
+        return out
+
+    local_brain = MagicMock()
+    local_brain.vectorize_batch = MagicMock(side_effect=vectorize_batch)
+    cloud_brain = MagicMock()
+    cloud_brain.max_concurrency = 2
+    mgr = AutonomousManager(db_path=str(tmp_path / "t.db"), local_brain=local_brain, cloud_brain=cloud_brain)
+    await mgr.storage.initialize()
+
+    def item(title, stars=50, language="Python", url=None):
+        return {"full_name": title, "html_url": url or f"https://github.com/{title}",
+                "stargazers_count": stars, "language": language}
+
+    items = [item(t) for t in sims] + [
+        item("o/high", url="https://github.com/o/high"),  # same URL twice in one page
+        item("o/tiny", stars=1),
+        item("o/rust", language="Rust"),
+    ]
+    fetched = []
+
+    async def process_item(self, it, page_cache=None, pending=None):
+        fetched.append(it["full_name"])
+        await asyncio.sleep(0)
+        return RawFinding(it["full_name"], it["html_url"], "a reasonably long description",
+                          it["stargazers_count"], it["language"], "readme")
+
+    running = peak = 0
+
+    async def analyze(finding):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "ai", 0.8
+
+    monkeypatch.setattr(Hunter, "find_tactic_items", AsyncMock(return_value=(items, "q")))
+    monkeypatch.setattr(Hunter, "_process_item", process_item)
+    monkeypatch.setattr(mgr, "_interest_matrix", lambda mission: np.eye(1, 8, dtype=np.float32))
+    monkeypatch.setattr(mgr, "_analyze_readme", analyze)
+    mgr.thresholds.get_threshold = AsyncMock(return_value=0.25)
+    mission = MagicMock(min_stars=10, languages=["Python"], ai_strategy=None)
+    mission.name, mission.goal = "m", "g"
+
+    try:
+        await mgr.run_research_cycle(mission)
+
+        # Stars/language prefilter runs before any README fetch
+        assert sorted(fetched) == sorted([t for t in sims] + ["o/high"])
+        assert mgr.session_stats["prefiltered"] == 2
+        assert mgr.session_stats["scanned"] == 7
+        # high auto-accepted, the four uncertain ones analysed, low filtered, duplicate dropped
+        assert mgr.session_stats["interested"] == 5
+        assert 1 < peak <= cloud_brain.max_concurrency
+        assert await mgr.storage.get_known_urls() == {f"https://github.com/{t}" for t in sims}
+
+        # Second cycle: every saved URL is skipped before fetching
+        fetched.clear()
+        await mgr.run_research_cycle(mission)
+        assert fetched == []
+        assert mgr.session_stats["prefiltered"] == 4
+    finally:
+        await mgr._get_hunter().close()
+        await mgr.storage.close()
+
+def test_menu_mission_count_does_not_copy(tmp_path, monkeypatch):
+    from tuner.menu import InteractiveMenu
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "missions.json").write_text('[{"name": "a"}, {"name": "b"}]')
+    menu = InteractiveMenu()
+
+    with patch("tuner.menu.copy.deepcopy") as deepcopy:
+        assert menu.mission_count() == 2
+        deepcopy.assert_not_called()
+
+    # load_missions still hands out a copy callers can edit
+    missions = menu.load_missions()
+    missions.append({"name": "c"})
+    assert menu.mission_count() == 2